@@ -28,7 +28,7 @@ from pydantic import BaseModel  # 데이터 검증 모델
 # 로컬 모듈 임포트
 from mcp_server_real import generate_author_chart, parse_chart_command, get_mcp_status  # 실제 MCP 서버
 from mcp_server import get_available_authors, get_chart_types  # 시뮬레이션 MCP 서버
-from database import db_manager, init_sample_data  # 데이터베이스 관리
+from database import get_db_manager, init_sample_data  # 데이터베이스 관리
 from config import config, setup_api_key  # 설정 관리
 from mcp_logger import mcp_logger, log_mcp_error  # 로깅 시스템
 
@@ -124,6 +124,10 @@ async def lifespan(app: FastAPI):
     
     # ========== 서버 종료 시 실행 ==========
     print("🛑 서버가 종료됩니다.")
+    
+    # 백그라운드로 예약된 MCP 로그 기록 마무리
+    from mcp_server_real import real_mcp_server
+    await real_mcp_server.flush_logs()
     await mcp_logger.log_system_event("서버 종료")
 
 # ==========================================
@@ -170,11 +174,11 @@ async def main_page(request: Request):
     """
     try:
         # 1. 최근 게시글 목록 조회 (성능을 위해 최대 10개로 제한)
-        posts = db_manager.get_all_posts()[:10]
+        posts = get_db_manager().get_all_posts()[:10]
         
         # 2. 차트 생성 가능한 작성자 목록 조회
         # numeric_value가 있는 게시글의 작성자들만 필터링
-        available_authors = db_manager.get_authors_with_numeric_data()
+        available_authors = get_db_manager().get_authors_with_numeric_data()
         
         # 3. 템플릿에 데이터 전달하여 HTML 렌더링
         return templates.TemplateResponse(
@@ -345,6 +349,10 @@ async def manage_post_with_mcp(request: PostManagementRequest):
                 }
             )
         
+        # 실행에 실패한 명령은 캐시된 파싱 결과를 버려 다음에 다시 파싱
+        if not result.get("success", False):
+            real_mcp_server.invalidate_post_command(request.command)
+        
         # MCP 로그 기록
         await mcp_logger.log_system_event(f"MCP 게시글 관리 - {action}", {
             "command": request.command,
@@ -392,7 +400,7 @@ async def _handle_create_post(parsed_result: dict):
             }
         
         # 데이터베이스에 게시글 저장
-        post = db_manager.add_post(
+        post = get_db_manager().add_post(
             author=author,
             title=title,
             content=content,
@@ -429,7 +437,7 @@ async def _handle_update_post(parsed_result: dict):
             }
         
         # 게시글 존재 여부 확인
-        existing_post = db_manager.get_post_by_id(post_id)
+        existing_post = get_db_manager().get_post_by_id(post_id)
         if not existing_post:
             return {
                 "success": False,
@@ -439,11 +447,11 @@ async def _handle_update_post(parsed_result: dict):
         
         # 필드별 수정 처리 (한국어/영어 필드명 매핑)
         if field_to_update in ["title", "제목"]:
-            success = db_manager.update_post(post_id, new_value, existing_post.content, existing_post.author)
+            success = get_db_manager().update_post(post_id, new_value, existing_post.content, existing_post.author)
         elif field_to_update in ["content", "내용"]:
-            success = db_manager.update_post(post_id, existing_post.title, new_value, existing_post.author)
+            success = get_db_manager().update_post(post_id, existing_post.title, new_value, existing_post.author)
         elif field_to_update in ["author", "작성자"]:
-            success = db_manager.update_post(post_id, existing_post.title, existing_post.content, new_value)
+            success = get_db_manager().update_post(post_id, existing_post.title, existing_post.content, new_value)
         else:
             return {
                 "success": False,
@@ -482,7 +490,7 @@ async def _handle_delete_post(parsed_result: dict):
         
         if post_id:
             # 특정 게시글 삭제
-            existing_post = db_manager.get_post_by_id(post_id)
+            existing_post = get_db_manager().get_post_by_id(post_id)
             if not existing_post:
                 return {
                     "success": False,
@@ -490,7 +498,7 @@ async def _handle_delete_post(parsed_result: dict):
                     "status_code": 404
                 }
             
-            success = db_manager.delete_post(post_id)
+            success = get_db_manager().delete_post(post_id)
             if success:
                 return {
                     "success": True,
@@ -507,7 +515,7 @@ async def _handle_delete_post(parsed_result: dict):
                 
         elif filter_author:
             # 특정 작성자의 모든 게시글 삭제
-            author_posts = db_manager.get_posts_by_author(filter_author)
+            author_posts = get_db_manager().get_posts_by_author(filter_author)
             if not author_posts:
                 return {
                     "success": False,
@@ -517,7 +525,7 @@ async def _handle_delete_post(parsed_result: dict):
             
             deleted_count = 0
             for post in author_posts:
-                if db_manager.delete_post(post['id']):
+                if get_db_manager().delete_post(post['id']):
                     deleted_count += 1
             
             return {
@@ -548,7 +556,7 @@ async def _handle_list_posts(parsed_result: dict):
         
         if filter_author:
             # 특정 작성자의 게시글 목록
-            posts = db_manager.get_posts_by_author(filter_author)
+            posts = get_db_manager().get_posts_by_author(filter_author)
             if not posts:
                 return {
                     "success": True,
@@ -569,7 +577,7 @@ async def _handle_list_posts(parsed_result: dict):
             }
         else:
             # 전체 게시글 목록
-            posts = db_manager.get_all_posts()
+            posts = get_db_manager().get_all_posts()
             return {
                 "success": True,
                 "message": f"전체 게시글 {len(posts)}개를 찾았습니다.",
@@ -600,7 +608,7 @@ async def add_post(request: PostRequest):
             )
         
         # 데이터베이스에 게시글 저장
-        post = db_manager.add_post(
+        post = get_db_manager().add_post(
             author=request.author,
             title=request.title,
             content=request.content,
@@ -630,7 +638,7 @@ async def update_post(post_id: int, post_data: PostUpdate):
     """게시글 수정"""
     try:
         # 게시글 존재 여부 확인
-        existing_post = db_manager.get_post_by_id(post_id)
+        existing_post = get_db_manager().get_post_by_id(post_id)
         if not existing_post:
             return JSONResponse(
                 status_code=404,
@@ -638,7 +646,7 @@ async def update_post(post_id: int, post_data: PostUpdate):
             )
         
         # 게시글 업데이트
-        success = db_manager.update_post(post_id, post_data.title, post_data.content, post_data.author)
+        success = get_db_manager().update_post(post_id, post_data.title, post_data.content, post_data.author)
         
         if success:
             await mcp_logger.log_system_event("게시글 수정", {
@@ -665,7 +673,7 @@ async def delete_post(post_id: int):
     """게시글 삭제"""
     try:
         # 게시글 존재 여부 확인
-        existing_post = db_manager.get_post_by_id(post_id)
+        existing_post = get_db_manager().get_post_by_id(post_id)
         if not existing_post:
             return JSONResponse(
                 status_code=404,
@@ -673,7 +681,7 @@ async def delete_post(post_id: int):
             )
         
         # 게시글 삭제
-        success = db_manager.delete_post(post_id)
+        success = get_db_manager().delete_post(post_id)
         
         if success:
             await mcp_logger.log_system_event("게시글 삭제", {
@@ -699,7 +707,7 @@ async def delete_post(post_id: int):
 async def get_posts():
     """모든 게시글 조회 API"""
     try:
-        posts = db_manager.get_all_posts()
+        posts = get_db_manager().get_all_posts()
         return JSONResponse(
             content={
                 "success": True,
@@ -720,7 +728,7 @@ async def get_posts():
 async def get_posts_by_author(author_name: str):
     """특정 작성자의 게시글 조회 API"""
     try:
-        posts = db_manager.get_posts_by_author(author_name)
+        posts = get_db_manager().get_posts_by_author(author_name)
         return JSONResponse(
             content={
                 "success": True,
@@ -814,7 +822,7 @@ async def set_api_key(request: dict):
         
         # MCP 서버 재초기화
         from mcp_server_real import real_mcp_server
-        real_mcp_server._initialize_client()
+        real_mcp_server.reload_client()
         
         # 상태 확인
         status = await get_mcp_status()
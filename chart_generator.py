@@ -19,7 +19,7 @@ Chart.js JavaScript 코드를 동적으로 생성합니다.
 """
 
 import json                # JSON 직렬화 (JavaScript 호환)
-from database import db_manager  # 데이터베이스 접근
+from database import get_db_manager  # 데이터베이스 접근
 
 # ==========================================
 # 차트 생성 엔진 클래스
@@ -39,14 +39,15 @@ class ChartGenerator:
     4. 브라우저에서 실행 가능한 코드 반환
     """
     
-    def __init__(self):
+    @property
+    def db(self):
         """
-        차트 생성기 초기화
+        데이터베이스 매니저
         
-        데이터베이스 매니저와 연결하여 게시글 데이터에 접근할 수 있도록 설정
+        첫 조회 시점에 전역 매니저가 생성되므로, 모듈 import만으로는
+        데이터베이스 연결이 만들어지지 않습니다.
         """
-        # 데이터베이스 접근을 위한 매니저 연결
-        self.db = db_manager
+        return get_db_manager()
     
     def create_chart_js_code(self, author_data, chart_type="bar"):
         """
@@ -71,6 +71,10 @@ class Config:
         # 서버 포트 번호
         self.PORT: int = int(os.getenv("PORT", "8000"))
         
+        # uvicorn 워커 프로세스 수
+        # 로그, 파싱 캐시, 런타임에 설정한 API 키가 프로세스별 메모리에 있으므로 기본값은 1
+        self.WORKERS: int = int(os.getenv("WORKERS", "1"))
+        
         # 디버그 모드 (개발시 True, 프로덕션시 False)
         self.DEBUG: bool = os.getenv("DEBUG", "true").lower() == "true"
         
@@ -81,6 +85,9 @@ class Config:
         # 기본 AI 모델 (Anthropic Claude 모델명)
         self.DEFAULT_MODEL: str = os.getenv("DEFAULT_MODEL", "claude-3-5-sonnet-20241022")
         
+        # Anthropic API 최대 동시 호출 수
+        self.MAX_CONCURRENCY: int = int(os.getenv("MAX_CONCURRENCY", "40"))
+        
         # ========== 보안 설정 ==========
         # 애플리케이션 비밀 키 (세션, JWT 등에 사용)
         # 프로덕션에서는 반드시 강력한 랜덤 키로 변경해야 함
@@ -164,8 +171,10 @@ if __name__ == "__main__":
     print("=== MCP 게시판 설정 ===")
     print(f"HOST: {config.HOST}")
     print(f"PORT: {config.PORT}")
+    print(f"WORKERS: {config.WORKERS}")
     print(f"DATABASE_URL: {config.DATABASE_URL}")
     print(f"MCP_ENABLED: {config.MCP_ENABLED}")
+    print(f"MAX_CONCURRENCY: {config.MAX_CONCURRENCY}")
     print(f"API 키 설정됨: {config.is_api_key_configured()}")
     
     if not config.is_api_key_configured():
@@ -22,6 +22,9 @@ MCP 게시판 데이터베이스 관리 모듈
 
 # 데이터베이스 ORM 관련 임포트
 from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Text  # SQLAlchemy 핵심 타입
+from sqlalchemy import Index, text  # 인덱스 정의
+from sqlalchemy import event  # 연결 이벤트 (SQLite PRAGMA 설정용)
+from sqlalchemy import select  # Core 쿼리 (ORM 객체 생성 없이 조회)
 from sqlalchemy.ext.declarative import declarative_base  # 모델 베이스 클래스
 from sqlalchemy.orm import sessionmaker  # 세션 관리
 
@@ -62,6 +65,20 @@ class Post(Base):
     
     # 메타데이터
     created_at = Column(DateTime, default=datetime.utcnow)     # 생성 시간 (자동 설정)
+    
+    # 조회 성능용 인덱스
+    # - ix_posts_author: 작성자별 조회 (get_posts_by_author)
+    # - ix_posts_created_at_desc: 최신순 정렬 (get_all_posts)
+    # - ix_posts_author_numeric: 숫자 데이터가 있는 작성자 조회 (get_authors_with_numeric_data)
+    __table_args__ = (
+        Index("ix_posts_author", "author"),
+        Index("ix_posts_created_at_desc", created_at.desc()),
+        Index(
+            "ix_posts_author_numeric", "author", "numeric_value",
+            sqlite_where=text("numeric_value IS NOT NULL"),
+            postgresql_where=text("numeric_value IS NOT NULL")
+        ),
+    )
 
     def to_dict(self):
         """
@@ -83,6 +100,33 @@ class Post(Base):
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
 
+# ==========================================
+# SQLite 연결 설정
+# ==========================================
+
+# 새 연결마다 적용할 PRAGMA 목록
+# - journal_mode=WAL: 읽기/쓰기 동시 진행, 커밋당 fsync 감소
+# - synchronous=NORMAL: WAL 모드에서 안전한 수준으로 fsync 완화
+# - temp_store=MEMORY: 임시 테이블/인덱스를 메모리에 저장
+# - mmap_size: 256MB 메모리 맵 I/O
+# - cache_size: 64MB 페이지 캐시 (음수는 KB 단위)
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+def _set_sqlite_pragma(dbapi_conn, connection_record):
+    """SQLite 연결 생성 시 PRAGMA 적용"""
+    cursor = dbapi_conn.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 # ==========================================
 # 데이터베이스 관리 클래스
 # ==========================================
@@ -115,9 +159,15 @@ class DatabaseManager:
         Args:
             db_url (str): 데이터베이스 연결 URL (기본값: SQLite 파일)
         """
+        self.db_url = db_url
+        
         # SQLAlchemy 엔진 생성 (데이터베이스 연결 풀 관리)
         self.engine = create_engine(db_url)
         
+        # SQLite 성능 튜닝 (WAL 모드, 메모리 캐시 등)
+        if db_url.startswith("sqlite"):
+            event.listen(self.engine, "connect", _set_sqlite_pragma)
+        
         # 세션 팩토리 생성 (각 요청마다 새로운 세션 생성용)
         self.SessionLocal = sessionmaker(bind=self.engine)
         
@@ -129,9 +179,13 @@ class DatabaseManager:
         데이터베이스 테이블 생성
         
         SQLAlchemy 메타데이터를 기반으로 모든 테이블을 생성합니다.
-        이미 존재하는 테이블은 무시됩니다.
+        이미 존재하는 테이블은 무시되며, 기존 테이블에 빠진 인덱스는 추가로 생성합니다.
         """
         Base.metadata.create_all(bind=self.engine)
+        
+        # 인덱스 추가 이전에 만들어진 DB 파일에도 인덱스 적용
+        for index in Post.__table__.indexes:
+            index.create(bind=self.engine, checkfirst=True)
     
     def get_session(self):
         """
@@ -201,13 +255,30 @@ class DatabaseManager:
             session.close()
     
     def get_all_posts(self):
-        """모든 게시글 조회"""
-        session = self.get_session()
-        try:
-            posts = session.query(Post).order_by(Post.created_at.desc()).all()
-            return [post.to_dict() for post in posts]
-        finally:
-            session.close()
+        """
+        모든 게시글 조회 (최신순)
+        
+        ORM 객체를 생성하지 않고 Core select로 행을 바로 읽어옵니다.
+        JSON 응답/템플릿 호환을 위해 반환 직전에만 딕셔너리로 변환합니다.
+        
+        Returns:
+            list: Post.to_dict()와 같은 형태의 딕셔너리 리스트
+        """
+        stmt = select(
+            Post.id, Post.author, Post.title, Post.content,
+            Post.numeric_value, Post.category, Post.created_at
+        ).order_by(Post.created_at.desc())
+        
+        with self.engine.connect() as conn:
+            rows = conn.execute(stmt).mappings().all()
+        
+        posts = []
+        for row in rows:
+            post = dict(row)
+            created_at = post['created_at']
+            post['created_at'] = created_at.isoformat() if created_at else None
+            posts.append(post)
+        return posts
     
     def get_authors_with_numeric_data(self):
         """숫자 데이터가 있는 작성자 목록 조회"""
@@ -263,12 +334,29 @@ class DatabaseManager:
         finally:
             session.close()
 
-# 전역 데이터베이스 매니저 인스턴스
-db_manager = DatabaseManager()
+# 전역 데이터베이스 매니저 인스턴스 (첫 사용 시 생성)
+_db_manager = None
+
+def get_db_manager():
+    """
+    전역 데이터베이스 매니저 반환
+    
+    모듈 import 시점에는 엔진 생성/테이블 생성을 하지 않고,
+    처음 호출될 때 DatabaseManager를 생성합니다.
+    
+    Returns:
+        DatabaseManager: 전역 데이터베이스 매니저 인스턴스
+    """
+    global _db_manager
+    if _db_manager is None:
+        _db_manager = DatabaseManager()
+    return _db_manager
 
 def init_sample_data():
     """샘플 데이터 초기화"""
     try:
+        db_manager = get_db_manager()
+        
         # 기존 데이터가 있는지 확인
         posts = db_manager.get_all_posts()
         if len(posts) == 0:
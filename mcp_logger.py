@@ -5,19 +5,46 @@ MCP 통신 로그 수집 및 관리 시스템
 
 import asyncio
 import json
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+import time
+from collections import deque
+from typing import List, Dict, Any, Optional, Literal, Deque
 from dataclasses import dataclass, asdict
-from enum import Enum
 
 
-class LogLevel(Enum):
-    """로그 레벨"""
-    INFO = "info"
-    SUCCESS = "success"
-    WARNING = "warning"
-    ERROR = "error"
-    DEBUG = "debug"
+# 로그 레벨 (문자열 상수)
+LEVEL_INFO = "info"
+LEVEL_SUCCESS = "success"
+LEVEL_WARNING = "warning"
+LEVEL_ERROR = "error"
+LEVEL_DEBUG = "debug"
+
+# 로그 레벨 타입 힌트용
+LogLevel = Literal["info", "success", "warning", "error", "debug"]
+
+
+# 콘솔 출력 대기열 최대 크기 (가득 차면 가장 오래된 항목부터 버림)
+PENDING_MAX_SIZE = 8192
+
+# 백그라운드 출력 태스크가 한 번에 처리하는 로그 수
+DRAIN_BATCH_SIZE = 256
+
+
+# 로그 레벨별 콘솔 아이콘
+_ICON_MAP = {
+    LEVEL_INFO: "ℹ️",
+    LEVEL_SUCCESS: "✅",
+    LEVEL_WARNING: "⚠️",
+    LEVEL_ERROR: "❌",
+    LEVEL_DEBUG: "🔍"
+}
+
+# 콘솔에 요약 출력할 details 항목 (키, 아이콘, 라벨)
+_DETAIL_FIELDS = (
+    ("command", "📝", "명령"),
+    ("author_names", "👥", "작성자"),
+    ("chart_type", "📊", "차트"),
+    ("method", "🔧", "방식"),
+)
 
 
 @dataclass
@@ -32,9 +59,7 @@ class MCPLogEntry:
     
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환"""
-        result = asdict(self)
-        result['level'] = self.level.value
-        return result
+        return asdict(self)
 
 
 class MCPLogger:
@@ -42,8 +67,60 @@ class MCPLogger:
     
     def __init__(self, max_logs: int = 100):
         self.max_logs = max_logs
-        self.logs: List[MCPLogEntry] = []
+        
+        # 최근 로그 링 버퍼 (최대 개수를 넘으면 가장 오래된 로그부터 자동 제거)
+        self.logs: Deque[MCPLogEntry] = deque(maxlen=max_logs)
         self._lock = asyncio.Lock()
+        
+        # 콘솔 출력 대기열과 이를 비우는 백그라운드 태스크
+        self._pending: Deque[MCPLogEntry] = deque(maxlen=PENDING_MAX_SIZE)
+        self._drain_task: Optional[asyncio.Task] = None
+        
+        # 초 단위 타임스탬프 캐시 (같은 초 안에서는 localtime 호출 생략)
+        self._last_sec = 0
+        self._last_hms = ""
+    
+    def _timestamp(self) -> str:
+        """HH:MM:SS.mmm 형식 타임스탬프 생성"""
+        sec, ms = divmod(time.time_ns() // 1_000_000, 1000)
+        if sec != self._last_sec:
+            t = time.localtime(sec)
+            self._last_hms = f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+            self._last_sec = sec
+        return f"{self._last_hms}.{ms:03d}"
+    
+    def enqueue(
+        self, 
+        level: LogLevel, 
+        category: str, 
+        message: str, 
+        details: Optional[Dict[str, Any]] = None,
+        duration_ms: Optional[float] = None
+    ):
+        """
+        로그 추가 (대기 없이 즉시 반환)
+        
+        로그는 바로 링 버퍼에 저장되고, 콘솔 출력은 백그라운드 태스크가 순서대로 처리합니다.
+        실행 중인 이벤트 루프가 없으면 바로 출력합니다.
+        """
+        entry = MCPLogEntry(
+            timestamp=self._timestamp(),
+            level=level,
+            category=category,
+            message=message,
+            details=details,
+            duration_ms=duration_ms
+        )
+        self.logs.append(entry)
+        self._pending.append(entry)
+        
+        if self._drain_task is not None and not self._drain_task.done():
+            return
+        
+        try:
+            self._drain_task = asyncio.get_running_loop().create_task(self._drain())
+        except RuntimeError:
+            self._drain_pending()
     
     async def log(
         self, 
@@ -53,81 +130,72 @@ class MCPLogger:
         details: Optional[Dict[str, Any]] = None,
         duration_ms: Optional[float] = None
     ):
-        """로그 추가"""
-        async with self._lock:
-            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-            
-            entry = MCPLogEntry(
-                timestamp=timestamp,
-                level=level,
-                category=category,
-                message=message,
-                details=details,
-                duration_ms=duration_ms
-            )
-            
-            self.logs.append(entry)
-            
-            # 최대 로그 수 제한
-            if len(self.logs) > self.max_logs:
-                self.logs = self.logs[-self.max_logs:]
-            
-            # 콘솔에도 출력
-            self._print_log(entry)
+        """로그 추가 (기존 호출부 호환용, enqueue와 동일)"""
+        self.enqueue(level, category, message, details, duration_ms)
+    
+    def _drain_pending(self, limit: Optional[int] = None):
+        """출력 대기열의 로그를 최대 limit개까지 콘솔에 출력"""
+        count = 0
+        while self._pending and (limit is None or count < limit):
+            self._print_log(self._pending.popleft())
+            count += 1
+    
+    async def _drain(self):
+        """출력 대기열이 빌 때까지 DRAIN_BATCH_SIZE개씩 출력 (배치 사이에 이벤트 루프 양보)"""
+        while self._pending:
+            self._drain_pending(DRAIN_BATCH_SIZE)
+            await asyncio.sleep(0)
+    
+    async def flush(self):
+        """출력 대기 중인 로그를 모두 출력 (서버 종료 시 사용)"""
+        if self._drain_task is not None:
+            await self._drain_task
+        self._drain_pending()
     
     def _print_log(self, entry: MCPLogEntry):
         """콘솔에 로그 출력"""
-        icon_map = {
-            LogLevel.INFO: "ℹ️",
-            LogLevel.SUCCESS: "✅",
-            LogLevel.WARNING: "⚠️",
-            LogLevel.ERROR: "❌",
-            LogLevel.DEBUG: "🔍"
-        }
-        
-        icon = icon_map.get(entry.level, "📝")
+        icon = _ICON_MAP.get(entry.level, "📝")
         duration_str = f" ({entry.duration_ms:.1f}ms)" if entry.duration_ms else ""
         
         print(f"{icon} [{entry.timestamp}] {entry.category.upper()}: {entry.message}{duration_str}")
         
         if entry.details:
             # 중요한 정보만 간략하게 출력
-            if 'command' in entry.details:
-                print(f"    📝 명령: {entry.details['command']}")
-            if 'author_names' in entry.details:
-                print(f"    👥 작성자: {entry.details['author_names']}")
-            if 'chart_type' in entry.details:
-                print(f"    📊 차트: {entry.details['chart_type']}")
-            if 'method' in entry.details:
-                print(f"    🔧 방식: {entry.details['method']}")
+            for key, emoji, label in _DETAIL_FIELDS:
+                if key in entry.details:
+                    print(f"    {emoji} {label}: {entry.details[key]}")
     
     async def get_logs(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """로그 조회"""
         async with self._lock:
-            logs_to_return = self.logs[-limit:] if limit else self.logs
+            logs_to_return = list(self.logs)[-limit:] if limit else self.logs
             return [log.to_dict() for log in logs_to_return]
     
     async def clear_logs(self):
         """로그 초기화"""
         async with self._lock:
             self.logs.clear()
-            await self.log(LogLevel.INFO, "system", "로그가 초기화되었습니다.")
+            await self.log(LEVEL_INFO, "system", "로그가 초기화되었습니다.")
     
-    async def log_api_call(self, api_name: str, parameters: Dict[str, Any]):
-        """API 호출 로그"""
-        await self.log(
-            LogLevel.INFO,
+    # ------------------------------------------
+    # 요청 처리 로그 (*_nowait): 호출 시점에 바로 링 버퍼에 추가되므로 기록 순서가 호출 순서와 같음
+    # ------------------------------------------
+    
+    def log_api_call_nowait(self, api_name: str, parameters: Dict[str, Any]):
+        """API 호출 로그 (대기 없이 즉시 기록)"""
+        self.enqueue(
+            LEVEL_INFO,
             "api_call",
             f"{api_name} API 호출",
             {"api": api_name, "parameters": parameters}
         )
     
-    async def log_api_response(self, api_name: str, success: bool, duration_ms: float, details: Dict[str, Any]):
-        """API 응답 로그"""
-        level = LogLevel.SUCCESS if success else LogLevel.ERROR
+    def log_api_response_nowait(self, api_name: str, success: bool, duration_ms: float, details: Dict[str, Any]):
+        """API 응답 로그 (대기 없이 즉시 기록)"""
+        level = LEVEL_SUCCESS if success else LEVEL_ERROR
         status = "성공" if success else "실패"
         
-        await self.log(
+        self.enqueue(
             level,
             "api_call",
             f"{api_name} API {status}",
@@ -135,17 +203,17 @@ class MCPLogger:
             duration_ms
         )
     
-    async def log_parsing(self, command: str, result: Dict[str, Any], duration_ms: float):
-        """파싱 결과 로그"""
+    def log_parsing_nowait(self, command: str, result: Dict[str, Any], duration_ms: float):
+        """파싱 결과 로그 (대기 없이 즉시 기록)"""
         is_valid = result.get('valid', False)
-        level = LogLevel.SUCCESS if is_valid else LogLevel.WARNING
+        level = LEVEL_SUCCESS if is_valid else LEVEL_WARNING
         
         method = result.get('method', 'unknown')
         confidence = result.get('confidence', 0)
         
         message = f"명령어 파싱 완료 (방식: {method}, 신뢰도: {confidence:.2f})"
         
-        await self.log(
+        self.enqueue(
             level,
             "parsing",
             message,
@@ -161,31 +229,42 @@ class MCPLogger:
             duration_ms
         )
     
-    async def log_chart_generation(self, chart_type: str, authors: List[str], success: bool, method: str, duration_ms: float):
-        """차트 생성 로그"""
-        level = LogLevel.SUCCESS if success else LogLevel.ERROR
-        status = "성공" if success else "실패"
-        author_text = ", ".join(authors) if authors else "없음"
+    def log_request_complete_nowait(
+        self,
+        endpoint: str,
+        success: bool,
+        duration_ms: float,
+        payload: Dict[str, Any],
+        category: str = "api_call"
+    ):
+        """
+        요청 완료 로그 (응답 + 파싱/차트 결과를 하나의 레코드로, 대기 없이 즉시 기록)
         
-        message = f"{chart_type} 차트 생성 {status} (작성자: {author_text})"
+        payload에 valid=False가 있으면 요청은 성공했어도 경고 레벨로 기록합니다.
+        """
+        if not success:
+            level = LEVEL_ERROR
+        elif payload.get("valid", True):
+            level = LEVEL_SUCCESS
+        else:
+            level = LEVEL_WARNING
         
-        await self.log(
+        status = "성공" if success else "실패"
+        method = payload.get("method")
+        message = f"{endpoint} {status}" + (f" (방식: {method})" if method else "")
+        
+        self.enqueue(
             level,
-            "chart_generation",
+            category,
             message,
-            {
-                "chart_type": chart_type,
-                "authors": authors,
-                "method": method,
-                "success": success
-            },
+            {"endpoint": endpoint, "success": success, **payload},
             duration_ms
         )
     
     async def log_system_event(self, event: str, details: Optional[Dict[str, Any]] = None):
         """시스템 이벤트 로그"""
         await self.log(
-            LogLevel.INFO,
+            LEVEL_INFO,
             "system",
             event,
             details
@@ -194,7 +273,7 @@ class MCPLogger:
     async def log_error(self, category: str, error_message: str, details: Optional[Dict[str, Any]] = None):
         """에러 로그"""
         await self.log(
-            LogLevel.ERROR,
+            LEVEL_ERROR,
             category,
             f"오류 발생: {error_message}",
             details
@@ -208,24 +287,24 @@ mcp_logger = MCPLogger(max_logs=200)
 # 편의 함수들
 async def log_mcp_info(category: str, message: str, details: Dict[str, Any] = None):
     """정보 로그"""
-    await mcp_logger.log(LogLevel.INFO, category, message, details)
+    await mcp_logger.log(LEVEL_INFO, category, message, details)
 
 
 async def log_mcp_success(category: str, message: str, details: Dict[str, Any] = None, duration_ms: float = None):
     """성공 로그"""
-    await mcp_logger.log(LogLevel.SUCCESS, category, message, details, duration_ms)
+    await mcp_logger.log(LEVEL_SUCCESS, category, message, details, duration_ms)
 
 
 async def log_mcp_warning(category: str, message: str, details: Dict[str, Any] = None):
     """경고 로그"""
-    await mcp_logger.log(LogLevel.WARNING, category, message, details)
+    await mcp_logger.log(LEVEL_WARNING, category, message, details)
 
 
 async def log_mcp_error(category: str, message: str, details: Dict[str, Any] = None):
     """에러 로그"""
-    await mcp_logger.log(LogLevel.ERROR, category, message, details)
+    await mcp_logger.log(LEVEL_ERROR, category, message, details)
 
 
 async def log_mcp_debug(category: str, message: str, details: Dict[str, Any] = None):
     """디버그 로그"""
-    await mcp_logger.log(LogLevel.DEBUG, category, message, details)
\ No newline at end of file
+    await mcp_logger.log(LEVEL_DEBUG, category, message, details)
\ No newline at end of file
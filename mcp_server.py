@@ -2,9 +2,83 @@
 MCP 서버 구성
 """
 
+import functools
 import re
 from chart_generator import chart_generator
 
+# 차트 타입별 키워드 (검사 순서 유지)
+_CHART_KEYWORDS = (
+    ("line", ("선그래프", "라인", "선형", "꺾은선")),
+    ("pie", ("원그래프", "파이", "원형")),
+    ("doughnut", ("도넛", "도너츠")),
+    ("bar", ("막대", "바", "막대그래프", "바차트")),
+)
+
+# 대소문자 구분이 의미 있는 (소문자 ASCII) 키워드 존재 여부
+_HAS_ASCII_KEYWORD = any(
+    keyword.isascii() and keyword.islower()
+    for _, keywords in _CHART_KEYWORDS
+    for keyword in keywords
+)
+
+@functools.lru_cache(maxsize=1024)
+def _parse_chart_command_cached(command: str):
+    """
+    자연어 명령 파싱 (동기, 결과 캐시)
+    
+    입력 문자열에만 의존하는 순수 함수이므로 명령 문자열을 키로 결과를 캐시합니다.
+    반환된 딕셔너리는 캐시와 공유되므로 호출자는 복사해서 사용해야 합니다.
+    
+    Args:
+        command (str): 앞뒤 공백이 제거된 자연어 명령
+        
+    Returns:
+        dict: 파싱된 작성자명과 차트 타입
+    """
+    # 작성자명 추출 패턴들
+    author_patterns = [
+        r'(\w+)의\s*(?:데이터|값|수치|글)',  # "홍길동의 데이터"
+        r'(\w+)\s*작성자',  # "홍길동 작성자"
+        r'(\w+)\s*님',      # "홍길동님"
+        r'"([^"]+)"',       # "홍길동" (따옴표로 감싼 경우)
+        r"'([^']+)'",       # '홍길동' (따옴표로 감싼 경우)
+    ]
+    
+    author_name = None
+    for pattern in author_patterns:
+        match = re.search(pattern, command)
+        if match:
+            author_name = match.group(1).strip()
+            break
+    
+    # 차트 타입 추출
+    chart_type = "bar"  # 기본값
+    
+    # 소문자 ASCII 키워드가 있을 때만 소문자 변환본도 검사 (한글 키워드만 있으면 생략)
+    haystacks = (command, command.lower()) if _HAS_ASCII_KEYWORD else (command,)
+    for ctype, keywords in _CHART_KEYWORDS:
+        for keyword in keywords:
+            if any(keyword in hay for hay in haystacks):
+                chart_type = ctype
+                break
+        if chart_type != "bar":  # 기본값이 아닌 타입을 찾았으면 중단
+            break
+    
+    # 명령어 유효성 검사
+    is_valid = author_name is not None and len(author_name) > 0
+    
+    return {
+        "author_name": author_name,
+        "chart_type": chart_type,
+        "valid": is_valid,
+        "parsed_command": {
+            "original": command,
+            "extracted_author": author_name,
+            "extracted_chart_type": chart_type
+        }
+    }
+
+
 class MCPServer:
     """MCP 서버 시뮬레이션 클래스"""
     
@@ -71,6 +145,8 @@ class MCPServer:
         """
         자연어 명령을 파싱해서 차트 생성 파라미터 추출
         
+        같은 명령은 캐시된 결과를 사용합니다 (_parse_chart_command_cached 참고).
+        
         Args:
             command (str): 사용자가 입력한 자연어 명령
             
@@ -78,56 +154,10 @@ class MCPServer:
             dict: 파싱된 작성자명과 차트 타입
         """
         try:
-            command = command.strip()
-            
-            # 작성자명 추출 패턴들
-            author_patterns = [
-                r'(\w+)의\s*(?:데이터|값|수치|글)',  # "홍길동의 데이터"
-                r'(\w+)\s*작성자',  # "홍길동 작성자"
-                r'(\w+)\s*님',      # "홍길동님"
-                r'"([^"]+)"',       # "홍길동" (따옴표로 감싼 경우)
-                r"'([^']+)'",       # '홍길동' (따옴표로 감싼 경우)
-            ]
-            
-            author_name = None
-            for pattern in author_patterns:
-                match = re.search(pattern, command)
-                if match:
-                    author_name = match.group(1).strip()
-                    break
-            
-            # 차트 타입 추출
-            chart_type = "bar"  # 기본값
-            
-            chart_type_keywords = {
-                "line": ["선그래프", "라인", "선형", "꺾은선"],
-                "pie": ["원그래프", "파이", "원형"],
-                "doughnut": ["도넛", "도너츠"],
-                "bar": ["막대", "바", "막대그래프", "바차트"]
-            }
-            
-            command_lower = command.lower()
-            for ctype, keywords in chart_type_keywords.items():
-                for keyword in keywords:
-                    if keyword in command or keyword in command_lower:
-                        chart_type = ctype
-                        break
-                if chart_type != "bar":  # 기본값이 아닌 타입을 찾았으면 중단
-                    break
-            
-            # 명령어 유효성 검사
-            is_valid = author_name is not None and len(author_name) > 0
-            
-            return {
-                "author_name": author_name,
-                "chart_type": chart_type,
-                "valid": is_valid,
-                "parsed_command": {
-                    "original": command,
-                    "extracted_author": author_name,
-                    "extracted_chart_type": chart_type
-                }
-            }
+            # 캐시된 결과가 호출자 쪽 수정으로 오염되지 않도록 복사본 반환
+            # (중첩된 딕셔너리는 parsed_command 하나뿐이고 나머지 값은 불변이므로 두 단계 얕은 복사로 충분)
+            cached = _parse_chart_command_cached(command.strip())
+            return {**cached, "parsed_command": dict(cached["parsed_command"])}
             
         except Exception as e:
             return {
@@ -19,22 +19,609 @@ MCP (Model Context Protocol) 개념:
 """
 
 # 표준 라이브러리 임포트
-import json      # JSON 데이터 처리
+import copy      # 캐시 결과 복사
 import re        # 정규식 패턴 매칭 (폴백 파싱용)
 import asyncio   # 비동기 처리
 import time      # 성능 측정용
+from string import Template  # 폴백 차트 코드 템플릿
+from collections import OrderedDict, defaultdict  # LRU 캐시, 그룹화
+from dataclasses import dataclass, field          # 다중 작성자 데이터 구조
 
 # 타입 힌팅
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Set, Union, Literal
 
 # 외부 라이브러리
+import orjson                         # 고속 JSON 직렬화 (차트 코드 생성용)
 from anthropic import AsyncAnthropic  # Anthropic Claude API 클라이언트
+from pydantic import BaseModel, ValidationError  # AI 응답 검증
+
+# 선택 라이브러리: RE2(google-re2)가 있으면 게시글 관리 폴백 패턴을 선형 시간 엔진으로 매칭
+try:
+    import re2
+except ImportError:
+    re2 = None
 
 # 로컬 모듈
 from config import config                                    # 설정 관리
 from chart_generator import chart_generator                  # 차트 생성 엔진
 from mcp_logger import mcp_logger, log_mcp_warning, log_mcp_error  # 로깅 시스템
 
+# ==========================================
+# 명령 파싱 결과 캐시 설정
+# ==========================================
+
+# 캐시 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목부터 제거)
+INTENT_CACHE_MAX_SIZE = 500
+
+# 캐시 유효 시간 (초)
+INTENT_CACHE_TTL = 1800
+
+# 정규식 폴백 결과의 캐시 유효 시간 (초, AI 결과보다 짧게 유지)
+INTENT_CACHE_FALLBACK_TTL = 300
+
+# 이 값보다 신뢰도가 낮은 파싱 결과는 캐시하지 않음
+INTENT_CACHE_MIN_CONFIDENCE = 0.7
+
+# Message Batches API 상태 폴링 간격 (초, 지수 백오프)
+BATCH_POLL_INTERVAL = 20
+BATCH_POLL_MAX_INTERVAL = 120
+
+def _normalize_command(command: str) -> str:
+    """
+    캐시 키용 명령 정규화 (앞뒤 공백 제거, 연속 공백 축약)
+    
+    작성자명 조회는 대소문자를 구분하므로("John" != "john") 소문자 변환은 하지 않습니다.
+    """
+    return re.sub(r"\s+", " ", command.strip())
+
+
+def _post_command_cache_key(command: str) -> str:
+    """
+    게시글 관리 명령 캐시 키 (앞뒤 공백만 제거)
+    
+    제목/내용 같은 자유 텍스트가 명령에 그대로 들어가므로 대소문자나 내부 공백은 정규화하지 않습니다.
+    """
+    return command.strip()
+
+# ==========================================
+# 정규표현식 폴백 파싱 패턴 (모듈 로드 시 컴파일)
+# ==========================================
+
+# 작성자명 추출 패턴들
+_AUTHOR_PATTERNS = [re.compile(p) for p in (
+    r'(\w+)의\s*(?:데이터|값|수치|글)',
+    r'(\w+)\s*작성자',
+    r'(\w+)\s*님',
+    r'"([^"]+)"',
+    r"'([^']+)'",
+)]
+
+# "모든 사람들" 관련 표현
+_ALL_AUTHORS_PATTERNS = [re.compile(p) for p in (
+    r'모든\s*사람들?',
+    r'전체\s*(?:사람들?|작성자|데이터)',
+    r'모든\s*작성자',
+    r'모두(?:\s*데이터|의)?',
+    r'전부(?:\s*데이터|의)?',
+)]
+
+# 다중 작성자 패턴
+_MULTI_AUTHOR_PATTERNS = [re.compile(p) for p in (
+    r'(\w+)[과와,]\s*(\w+)',  # "홍길동과 김철수"
+    r'(\w+)\s+(\w+)(?:\s+데이터|의)',  # "홍길동 김철수 데이터"
+)]
+
+# 차트 타입별 키워드 (검사 순서 유지)
+_CHART_KEYWORDS = (
+    ("line", ("선그래프", "라인", "선형", "꺾은선")),
+    ("pie", ("원그래프", "파이", "원형")),
+    ("doughnut", ("도넛", "도너츠")),
+    ("bar", ("막대", "바", "막대그래프", "바차트")),
+)
+
+# 키워드 -> 차트 타입, 차트 타입 -> 우선순위 (_CHART_KEYWORDS 순서)
+_CHART_KEYWORD_TYPES = {keyword.lower(): ctype for ctype, keywords in _CHART_KEYWORDS for keyword in keywords}
+_CHART_TYPE_PRIORITY = {ctype: i for i, (ctype, _) in enumerate(_CHART_KEYWORDS)}
+
+# 모든 차트 키워드를 한 번에 찾는 패턴 (긴 키워드 우선)
+_CHART_KEYWORD_RE = re.compile(
+    "|".join(re.escape(keyword) for keyword in sorted(_CHART_KEYWORD_TYPES, key=len, reverse=True)),
+    re.IGNORECASE
+)
+
+# AI 응답의 JavaScript 코드 블록 (닫는 ```가 없으면 응답 끝까지)
+_JS_FENCE_RE = re.compile(r"```(?:javascript|js)?\s*(.*?)(?:```|$)", re.DOTALL)
+
+# ==========================================
+# 게시글 관리 명령 폴백 파싱 패턴 (모듈 로드 시 컴파일)
+# ==========================================
+
+def _compile_fallback(pattern: str):
+    """
+    게시글 관리 폴백 패턴 컴파일 (RE2가 설치되어 있으면 RE2, 없으면 표준 re)
+    
+    RE2는 백트래킹 없이 입력 길이에 비례하는 시간으로 매칭하므로,
+    길거나 악의적인 명령에서도 `(.+?)...` 형태 패턴의 처리 시간이 폭증하지 않습니다.
+    RE2의 단어 문자 클래스는 ASCII만 매칭하므로, 한글 작성자명을 단어 문자로 잡는 차트 패턴에는 사용하지 않습니다.
+    """
+    if re2 is None:
+        return re.compile(pattern)
+    options = re2.Options()
+    options.log_errors = False
+    return re2.compile(pattern, options)
+
+
+# 작업 종류별 키워드 (해당 작업의 패턴이 매칭되려면 키워드 중 하나가 반드시 포함되어야 함)
+_POST_ACTION_KEYWORDS = {
+    "작성": "create", "생성": "create", "추가": "create",
+    "수정": "update", "변경": "update", "바꿔": "update",
+    "삭제": "delete",
+    "목록": "list", "리스트": "list", "보여": "list", "표시": "list",
+}
+
+# 폴백 파싱 기본 결과 (값은 모두 불변 객체이므로 얕은 복사로 충분)
+_FALLBACK_RESULT_TEMPLATE = {
+    "action": None,
+    "post_id": None,
+    "author": None,
+    "title": None,
+    "content": None,
+    "numeric_value": None,
+    "category": None,
+    "field_to_update": None,
+    "new_value": None,
+    "filter_author": None,
+    "valid": False,
+    "confidence": 0.7,
+    "explanation": "정규표현식으로 파싱됨",
+    "method": "regex_fallback",
+    "original_command": None
+}
+
+# 게시글 생성: 작성자명 바로 뒤에 오는 동작 표현 ("홍길동으로 게시글 작성", "홍길동 게시글 추가")
+_CREATE_SUFFIX_PATTERNS = [_compile_fallback(p) for p in (
+    r'으?로\s*(?:새\s*)?게시글\s*작성',
+    r'\s*게시글\s*(?:추가|생성|작성)',
+)]
+
+# 게시글 생성: "새 게시글 ... 작성자는 홍길동" 형식
+_CREATE_AUTHOR_FIELD_RE = _compile_fallback(r'새\s*게시글.*?작성자(?:\s*[:는])?\s*(.+?)(?:\s|$)')
+
+# 게시글 생성: "게시글 작성 ... 홍길동으로" 형식 (동작 표현 뒤의 작성자명)
+_CREATE_ACTION_RE = _compile_fallback(r'게시글\s*(?:추가|생성|작성)')
+_RO_PARTICLE_RE = _compile_fallback(r'으?로')
+
+# 생성 명령의 제목/내용/수치값 추출 패턴
+_TITLE_PATTERNS = [_compile_fallback(p) for p in (
+    r'제목(?:\s*[:은는])?\s*[\'"]([^\'\"]+)[\'"]',
+    r'제목(?:\s*[:은는])?\s*(.+?)(?:\s*,|\s*내용|\s*$)',
+)]
+
+_CONTENT_PATTERNS = [_compile_fallback(p) for p in (
+    r'내용(?:\s*[:은는])?\s*[\'"]([^\'\"]+)[\'"]',
+    r'내용(?:\s*[:은는])?\s*(.+?)(?:\s*,|\s*수치|\s*$)',
+)]
+
+_NUMERIC_RE = _compile_fallback(r'수치(?:값)?(?:\s*[:은는])?\s*([\d.]+)')
+
+# 게시글 수정 대상 필드명 (수정 패턴이 매칭되려면 이 중 하나가 반드시 포함되어야 함)
+_UPDATE_FIELDS = ("제목", "내용", "작성자")
+
+# 게시글 수정 패턴
+_UPDATE_PATTERNS = [_compile_fallback(p) for p in (
+    r'(\d+)번\s*게시글.*?(제목|내용|작성자)(?:\s*[을를])?\s*[\'"]?([^\'\"]+)[\'"]?으?로\s*(?:바꿔|수정|변경)',
+    r'(\d+)번.*?(제목|내용|작성자)\s*(?:수정|변경|바꿔).*?[\'"]?([^\'\"]+)[\'"]?',
+)]
+
+# 게시글 삭제 패턴 (게시글 번호)
+_DELETE_ID_PATTERNS = [_compile_fallback(p) for p in (
+    r'(\d+)번\s*게시글\s*삭제',
+    r'게시글\s*(\d+)\s*삭제',
+)]
+
+# 작성자별 전체 삭제: 작성자명 바로 뒤에 오는 동작 표현 ("홍길동의 모든 게시글 삭제")
+_DELETE_SUFFIX_RE = _compile_fallback(r'의?\s*(?:모든\s*)?게시글\s*(?:모두\s*)?삭제')
+
+# 게시글 목록 패턴 (두 번째는 작성자 필터 포함)
+_LIST_PATTERNS = [_compile_fallback(p) for p in (
+    r'게시글\s*(?:목록|리스트)\s*(?:보여|표시)',
+    r'(.+?)의?\s*게시글\s*(?:보여|표시|목록)',
+)]
+
+
+def _last_word_before(command: str, pattern: Any, start: int = 0) -> Optional[str]:
+    """
+    start 위치에서 한 글자 이상 떨어진 곳에서 pattern을 찾아, 그 앞 구간의 마지막 단어 반환
+    
+    `(.+?)접미사` 형태의 패턴은 접미사가 나올 때까지 모든 길이를 다시 시도하므로,
+    고정된 접미사를 한 번만 검색한 뒤 앞부분에서 단어를 잘라냅니다.
+    """
+    match = pattern.search(command, start + 1)
+    if not match:
+        return None
+    words = command[start:match.start()].split()
+    return words[-1] if words else None
+
+
+def _text_before(command: str, pattern: Any) -> Optional[str]:
+    """
+    첫 글자 이후에서 pattern을 찾아, 그 앞 구간 전체를 앞뒤 공백만 제거해 반환 (없으면 None)
+    
+    `(.+?)접미사` 패턴의 group(1).strip()과 같은 결과를 접미사 검색 한 번으로 구합니다.
+    "김 철수"처럼 공백이 들어간 이름도 그대로 유지해야 하는 경우에 사용합니다.
+    """
+    match = pattern.search(command, 1)
+    if not match:
+        return None
+    return command[:match.start()].strip()
+
+
+def _match_create_author(command: str) -> Optional[str]:
+    """게시글 생성 명령에서 작성자명 추출 (생성 명령 형식이 아니면 None)"""
+    for pattern in _CREATE_SUFFIX_PATTERNS:
+        author = _last_word_before(command, pattern)
+        if author:
+            return author
+    
+    match = _CREATE_AUTHOR_FIELD_RE.search(command)
+    if match:
+        return match.group(1).strip()
+    
+    action = _CREATE_ACTION_RE.search(command)
+    if action:
+        return _last_word_before(command, _RO_PARTICLE_RE, action.end())
+    return None
+
+# ==========================================
+# AI 프롬프트 템플릿 (호출마다 바뀌지 않는 부분)
+# ==========================================
+# 고정 부분을 프롬프트 맨 앞에 두고 cache_control을 지정해 Anthropic 프롬프트 캐시를 재사용합니다.
+# (모델별 최소 캐시 길이보다 짧으면 캐시 없이 일반 요청처럼 처리됩니다)
+
+# 차트 명령 파싱 프롬프트: STATIC + 명령
+_PARSE_PROMPT_STATIC = """
+다음 한국어 명령을 분석해서 차트 생성 정보를 추출해주세요.
+
+extract_chart_intent 도구로 다음 항목을 채워 응답해주세요:
+{
+    "author_names": ["작성자1", "작성자2"] 또는 null (여러 작성자 또는 없으면 null),
+    "author_name": "단일 작성자명 (호환성용, 없으면 null)",
+    "chart_type": "bar|line|pie|doughnut 중 하나",
+    "valid": true/false,
+    "confidence": 0.0-1.0,
+    "explanation": "파싱 결과 설명",
+    "is_multi_author": true/false
+}
+
+차트 타입 매핑:
+- 막대, 바, 막대그래프, 바차트 → "bar"
+- 선그래프, 라인, 선형, 꺾은선 → "line"  
+- 원그래프, 파이, 원형 → "pie"
+- 도넛, 도너츠 → "doughnut"
+
+작성자명 추출 규칙:
+- 단일: "홍길동의", "김철수님의", "이영희 데이터" → author_name: "홍길동", is_multi_author: false
+- 다중: "홍길동과 김철수", "홍길동, 김철수의", "홍길동 김철수 데이터" → author_names: ["홍길동", "김철수"], is_multi_author: true
+- 전체: "모든 사람들", "전체", "모든 작성자", "모두", "모든 사람" → author_names: "ALL_AUTHORS", is_multi_author: true
+- 없음: 작성자 언급 없음 → author_names: null, author_name: null, is_multi_author: false
+
+특별 처리:
+- "모든 사람들", "전체", "모든 작성자" 등의 표현은 author_names: "ALL_AUTHORS"로 설정
+- 여러 작성자가 감지되면 is_multi_author를 true로, author_names 배열에 모든 작성자를 포함하세요.
+"""
+
+# 단일 작성자 차트 코드 프롬프트: STATIC + 데이터
+_CHART_PROMPT_STATIC = """
+아래 데이터로 Chart.js 코드를 생성해주세요.
+
+요구사항:
+1. Chart.js 3.x 문법 사용
+2. 기존 차트 제거 코드 포함 (window.myChart 확인)
+3. 반응형 디자인
+4. 한국어 제목과 라벨
+5. 아름다운 색상 조합
+6. 캔버스 ID는 'dynamicChart' 사용
+
+다음 형식으로 완전한 JavaScript 코드를 생성해주세요:
+```javascript
+// 기존 차트 제거
+if (window.myChart) {
+    window.myChart.destroy();
+}
+
+// 새 차트 생성
+const ctx = document.getElementById('dynamicChart').getContext('2d');
+window.myChart = new Chart(ctx, {
+    // 차트 설정...
+});
+```
+
+응답은 JavaScript 코드만 반환해주세요.
+"""
+
+# 다중 작성자 차트 코드 프롬프트: STATIC + 데이터
+_MULTI_CHART_PROMPT_STATIC = """
+아래 다중 작성자 데이터로 Chart.js 코드를 생성해주세요.
+
+요구사항:
+1. Chart.js 3.x 문법 사용
+2. 기존 차트 제거 코드 포함 (window.myChart 확인)
+3. 다중 작성자를 구분할 수 있는 색상 사용
+4. 반응형 디자인
+5. 한국어 제목과 라벨
+6. 각 작성자별 구분되는 색상
+7. 범례 표시
+8. 캔버스 ID는 'dynamicChart' 사용
+
+차트 타입별 표시 방법:
+- pie/doughnut: 작성자별 총합으로 표시
+- bar/line: 모든 게시글을 작성자별 색상으로 구분
+
+응답은 JavaScript 코드만 반환해주세요.
+"""
+
+
+# 차트 명령 파싱용 도구 정의 (도구 호출로 항상 JSON 형태의 응답을 받음)
+_PARSE_TOOL = {
+    "name": "extract_chart_intent",
+    "description": "한국어 차트 생성 명령에서 작성자와 차트 타입을 추출합니다.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "author_names": {
+                "type": ["array", "string", "null"],
+                "items": {"type": "string"},
+                "description": "여러 작성자 목록, 전체 작성자는 \"ALL_AUTHORS\", 없으면 null"
+            },
+            "author_name": {
+                "type": ["string", "null"],
+                "description": "단일 작성자명 (호환성용, 없으면 null)"
+            },
+            "chart_type": {"type": "string", "enum": ["bar", "line", "pie", "doughnut"]},
+            "valid": {"type": "boolean"},
+            "confidence": {"type": "number", "minimum": 0, "maximum": 1},
+            "explanation": {"type": "string", "description": "파싱 결과 설명"},
+            "is_multi_author": {"type": "boolean"}
+        },
+        "required": ["chart_type", "valid", "confidence", "is_multi_author"]
+    }
+}
+
+# 게시글 관리 명령 파싱 시스템 프롬프트 (사용자 메시지에는 명령만 전달)
+_POST_PARSE_SYSTEM_PROMPT = """
+사용자가 입력한 한국어 명령을 분석해서 게시글 관리 정보를 추출해주세요.
+
+다음 JSON 형식으로 응답해주세요:
+{
+    "action": "create|update|delete|list 중 하나",
+    "post_id": 게시글ID (숫자, 수정/삭제시 필요, 없으면 null),
+    "author": "작성자명 (생성시 필요, 없으면 null)",
+    "title": "제목 (생성/수정시, 없으면 null)",
+    "content": "내용 (생성/수정시, 없으면 null)",
+    "numeric_value": 수치값 (숫자, 선택사항, 없으면 null),
+    "category": "카테고리 (선택사항, 없으면 null)",
+    "field_to_update": "수정할 필드명 (update시: title|content|author|numeric_value|category, 없으면 null)",
+    "new_value": "새로운 값 (update시, 없으면 null)",
+    "filter_author": "특정 작성자 (delete시 '모든', 없으면 null)",
+    "valid": true/false,
+    "confidence": 0.0-1.0,
+    "explanation": "파싱 결과 설명"
+}
+
+명령 유형별 예시:
+1. 생성: "홍길동으로 새 게시글 작성해줘. 제목은 '4월 매출', 내용은 '증가했습니다', 수치값은 250.5"
+   → action: "create", author: "홍길동", title: "4월 매출", content: "증가했습니다", numeric_value: 250.5
+
+2. 수정: "1번 게시글 제목을 '새 제목'으로 바꿔줘"
+   → action: "update", post_id: 1, field_to_update: "title", new_value: "새 제목"
+
+3. 삭제: "2번 게시글 삭제해줘"
+   → action: "delete", post_id: 2
+
+4. 전체 삭제: "홍길동의 모든 게시글 삭제해줘"
+   → action: "delete", filter_author: "홍길동"
+
+5. 목록: "게시글 목록 보여줘" 또는 "홍길동의 게시글 보여줘"
+   → action: "list", filter_author: "홍길동" (또는 null)
+"""
+
+
+def _cached_prompt(static_text: str, dynamic_text: str) -> List[Dict[str, Any]]:
+    """고정 부분에 캐시 지정을 붙인 메시지 content 블록 구성"""
+    return [
+        {"type": "text", "text": static_text, "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": dynamic_text}
+    ]
+
+# ==========================================
+# 폴백 Chart.js 코드 템플릿
+# ==========================================
+# 고정된 코드는 모듈 로드 시 한 번만 만들고, 호출 시에는 데이터 부분만 치환합니다.
+
+# 다중 작성자 차트 색상 팔레트
+_CHART_COLORS = [
+    'rgba(255, 99, 132, 0.8)',
+    'rgba(54, 162, 235, 0.8)',
+    'rgba(255, 205, 86, 0.8)',
+    'rgba(75, 192, 192, 0.8)',
+    'rgba(153, 102, 255, 0.8)',
+    'rgba(255, 159, 64, 0.8)',
+    'rgba(199, 199, 199, 0.8)',
+    'rgba(83, 102, 255, 0.8)'
+]
+
+# 원형/도넛 차트: 작성자별 총합
+_PIE_CHART_TEMPLATE = Template("""
+            if (window.myChart) {
+                window.myChart.destroy();
+            }
+            
+            const ctx = document.getElementById('dynamicChart').getContext('2d');
+            window.myChart = new Chart(ctx, {
+                type: '$chart_type',
+                data: {
+                    labels: $labels,
+                    datasets: [{
+                        data: $values,
+                        backgroundColor: $background_colors,
+                        borderWidth: 2
+                    }]
+                },
+                options: {
+                    responsive: true,
+                    plugins: {
+                        title: {
+                            display: true,
+                            text: '다중 작성자 데이터 차트 ($authors)'
+                        },
+                        legend: {
+                            display: true,
+                            position: 'bottom'
+                        }
+                    }
+                }
+            });
+            """)
+
+# 막대/선형 차트: 작성자별 데이터셋
+_BAR_CHART_TEMPLATE = Template("""
+            if (window.myChart) {
+                window.myChart.destroy();
+            }
+            
+            const ctx = document.getElementById('dynamicChart').getContext('2d');
+            window.myChart = new Chart(ctx, {
+                type: '$chart_type',
+                data: {
+                    labels: $labels,
+                    datasets: $datasets
+                },
+                options: {
+                    responsive: true,
+                    plugins: {
+                        title: {
+                            display: true,
+                            text: '다중 작성자 데이터 차트 ($authors)'
+                        },
+                        legend: {
+                            display: true,
+                            position: 'top'
+                        }
+                    },
+                    scales: {
+                        y: {
+                            beginAtZero: true,
+                            title: {
+                                display: true,
+                                text: '값'
+                            }
+                        }
+                    }
+                }
+            });
+            """)
+
+# ==========================================
+# 다중 작성자 / AI 응답 데이터 구조
+# ==========================================
+
+class ParsedPostCommand(BaseModel):
+    """
+    AI 게시글 관리 명령 파싱 응답 모델
+    
+    AI가 반환한 JSON을 한 번에 파싱하고 검증합니다.
+    형식이 맞지 않으면 ValidationError가 발생해 정규표현식 폴백으로 넘어갑니다.
+    """
+    action: Optional[Literal["create", "update", "delete", "list"]] = None
+    post_id: Optional[int] = None
+    author: Optional[str] = None
+    title: Optional[str] = None
+    content: Optional[str] = None
+    numeric_value: Optional[float] = None
+    category: Optional[str] = None
+    field_to_update: Optional[str] = None
+    new_value: Any = None  # 수정 필드에 따라 문자열 또는 숫자
+    filter_author: Optional[str] = None
+    valid: bool = False
+    confidence: float = 0.0
+    explanation: str = ""
+
+
+@dataclass
+class PostBatch:
+    """
+    다중 작성자 차트용 게시글 데이터
+    
+    게시글마다 작성자 필드를 붙인 딕셔너리를 새로 만드는 대신,
+    작성자/제목/값을 같은 인덱스끼리 대응하는 병렬 리스트로 저장합니다.
+    """
+    authors: List[str] = field(default_factory=list)
+    titles: List[str] = field(default_factory=list)
+    values: List[Optional[float]] = field(default_factory=list)
+    
+    def extend(self, author: str, posts: List[Dict]):
+        """한 작성자의 게시글 추가"""
+        self.authors.extend([author] * len(posts))
+        self.titles.extend(post['title'] for post in posts)
+        self.values.extend(post['numeric_value'] for post in posts)
+    
+    def __len__(self) -> int:
+        return len(self.authors)
+    
+    def rows(self):
+        """(작성자, 제목, 값) 튜플 순회"""
+        return zip(self.authors, self.titles, self.values)
+    
+    def values_by_author(self) -> Dict[str, List[Optional[float]]]:
+        """작성자별 값 리스트 (작성자 등장 순서 유지)"""
+        groups = defaultdict(list)
+        for author, value in zip(self.authors, self.values):
+            groups[author].append(value)
+        return groups
+
+
+class _JsonObjectScanner:
+    """
+    스트리밍 응답에서 첫 JSON 객체가 닫히는 위치를 찾는 스캐너
+    
+    청크가 도착할 때마다 새로 추가된 부분만 검사하며, 문자열 안의 중괄호는 무시합니다.
+    객체 앞의 설명 텍스트에 있는 따옴표 문자열("{" 등)도 추적해 객체 시작으로 오인하지 않습니다.
+    """
+    
+    def __init__(self):
+        self.start = -1   # 첫 '{' 위치
+        self.end = -1     # 짝이 맞는 '}' 다음 위치 (닫히기 전에는 -1)
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._pos = 0
+    
+    def feed(self, text: str) -> bool:
+        """누적된 응답 텍스트를 받아 객체가 닫혔으면 True 반환"""
+        for i in range(self._pos, len(text)):
+            ch = text[i]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == "{":
+                if self.start == -1:
+                    self.start = i
+                self._depth += 1
+            elif ch == "}" and self.start != -1:
+                self._depth -= 1
+                if self._depth == 0:
+                    self.end = i + 1
+                    self._pos = self.end
+                    return True
+        self._pos = len(text)
+        return False
+
 # ==========================================
 # MCP 실제 서버 클래스
 # ==========================================
@@ -68,6 +655,32 @@ class RealMCPServer:
         # Anthropic API 클라이언트 (초기값 None)
         self.client: Optional[AsyncAnthropic] = None
         
+        # 실제 MCP 사용 가능 여부 (클라이언트 초기화 시 갱신)
+        self._mcp_available: bool = False
+        
+        # 사용할 Claude 모델명 (클라이언트 초기화 시 설정에서 읽어옴)
+        self._model: str = config.DEFAULT_MODEL
+        
+        # 백그라운드로 실행 중인 작업 (파싱 결과 AI 재확인 등, 완료 전 GC 방지)
+        # 로그는 mcp_logger의 *_nowait 메서드로 즉시 기록하므로 여기에 포함되지 않음
+        self._bg_tasks: Set[asyncio.Task] = set()
+        
+        # Anthropic API 동시 호출 수 제한 (429 응답 및 이벤트 루프 과부하 방지)
+        # 모듈 import 시점에 만들면 Python 3.8/3.9에서 서버와 다른 이벤트 루프에 묶이므로 첫 사용 시 생성 (_get_api_sem 참고)
+        self._api_sem: Optional[asyncio.Semaphore] = None
+        
+        # 명령 파싱 결과 캐시 (정규화된 명령 -> {"result", "source": "ai"|"regex", "ts"})
+        self._intent_cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        
+        # AI 재파싱이 진행 중인 정규식 폴백 캐시 키 (중복 재파싱 방지)
+        self._intent_upgrades: Set[str] = set()
+        
+        # 진행 중인 차트 코드 생성 요청 (프롬프트 데이터 -> 응답 Future, 동일 요청 합치기용)
+        self._chart_requests: Dict[str, asyncio.Future] = {}
+        
+        # 게시글 관리 명령 AI 파싱 결과 캐시 (_intent_cache와 같은 항목 형태)
+        self._post_command_cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        
         # 클라이언트 초기화 시도
         self._initialize_client()
     
@@ -90,17 +703,48 @@ class RealMCPServer:
         else:
             print("⚠️ API 키가 설정되지 않았습니다. 시뮬레이션 모드로 실행됩니다.")
             self.client = None
+        
+        # 요청마다 API 키와 설정을 다시 확인하지 않도록 결과 저장
+        self._mcp_available = self.client is not None and config.is_api_key_configured()
+        self._model = config.DEFAULT_MODEL
+    
+    def _get_api_sem(self) -> asyncio.Semaphore:
+        """API 동시 호출 제한 세마포어 반환 (실행 중인 이벤트 루프 안에서 처음 호출될 때 생성)"""
+        if self._api_sem is None:
+            self._api_sem = asyncio.Semaphore(config.MAX_CONCURRENCY)
+        return self._api_sem
+    
+    def _spawn(self, coro):
+        """코루틴을 백그라운드 태스크로 실행하고 완료될 때까지 참조 유지"""
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+    
+    async def flush_logs(self):
+        """백그라운드 작업과 콘솔 출력 대기 중인 로그가 모두 끝날 때까지 대기 (서버 종료 시 사용)"""
+        if self._bg_tasks:
+            await asyncio.gather(*self._bg_tasks, return_exceptions=True)
+        await mcp_logger.flush()
+    
+    def reload_client(self):
+        """
+        Anthropic 클라이언트 재초기화
+        
+        API 키가 변경되었을 때 호출하여 클라이언트와 사용 가능 여부를 다시 설정합니다.
+        """
+        self._initialize_client()
     
     def is_real_mcp_available(self) -> bool:
         """
         실제 MCP 사용 가능 여부 확인
         
         Anthropic 클라이언트가 성공적으로 초기화되었고 API 키가 설정되었는지 확인합니다.
+        결과는 클라이언트 초기화 시점에 계산되며, API 키 변경 후에는 reload_client()를 호출해야 합니다.
         
         Returns:
             bool: 실제 MCP 사용 가능 여부
         """
-        return self.client is not None and config.is_api_key_configured()
+        return self._mcp_available
     
     async def generate_multi_author_chart(self, author_names: List[str], chart_type: str = "bar") -> Dict[str, Any]:
         """
@@ -113,9 +757,9 @@ class RealMCPServer:
         Returns:
             dict: 차트 생성 결과
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
-        await mcp_logger.log_api_call("generate_multi_author_chart", {
+        mcp_logger.log_api_call_nowait("generate_multi_author_chart", {
             "author_names": author_names,
             "chart_type": chart_type
         })
@@ -138,17 +782,19 @@ class RealMCPServer:
                     "method": "validation_error"
                 }
             
-            # 각 작성자의 데이터 수집
-            all_author_data = []
+            # 각 작성자의 데이터 수집 (DB 조회를 스레드에서 동시에 실행)
+            loop = asyncio.get_running_loop()
+            author_results = await asyncio.gather(*(
+                loop.run_in_executor(None, self.chart_gen.get_author_numeric_data, author)
+                for author in author_names
+            ))
+            
+            all_author_data = PostBatch()
             valid_authors = []
             
-            for author in author_names:
-                author_posts = self.chart_gen.get_author_numeric_data(author)
+            for author, author_posts in zip(author_names, author_results):
                 if author_posts:
-                    # 작성자 정보를 데이터에 추가
-                    for post in author_posts:
-                        post['author'] = author
-                    all_author_data.extend(author_posts)
+                    all_author_data.extend(author, author_posts)
                     valid_authors.append(author)
             
             if not all_author_data:
@@ -173,14 +819,13 @@ class RealMCPServer:
             method_msg = "🤖 AI로 생성됨" if chart_result["method"] == "ai_generated" else "⚙️ 로컬로 생성됨"
             
             # 성공 로그 기록
-            duration_ms = (time.time() - start_time) * 1000
-            await mcp_logger.log_chart_generation(chart_type, valid_authors, True, chart_result["method"], duration_ms)
-            await mcp_logger.log_api_response("generate_multi_author_chart", True, duration_ms, {
-                "authors": valid_authors,
+            duration_ms = (time.perf_counter_ns() - start_time) / 1_000_000
+            mcp_logger.log_request_complete_nowait("generate_multi_author_chart", True, duration_ms, {
+                "author_names": valid_authors,
                 "chart_type": chart_type,
                 "data_count": len(all_author_data),
                 "method": chart_result["method"]
-            })
+            }, category="chart_generation")
             
             return {
                 "success": True,
@@ -195,13 +840,17 @@ class RealMCPServer:
             
         except Exception as e:
             # 실패 로그 기록
-            duration_ms = (time.time() - start_time) * 1000
-            await mcp_logger.log_chart_generation(chart_type, author_names, False, "error", duration_ms)
+            duration_ms = (time.perf_counter_ns() - start_time) / 1_000_000
+            mcp_logger.log_request_complete_nowait("generate_multi_author_chart", False, duration_ms, {
+                "author_names": author_names,
+                "chart_type": chart_type,
+                "method": "error",
+                "error": str(e)
+            }, category="chart_generation")
             await mcp_logger.log_error("chart_generation", f"다중 작성자 차트 생성 실패: {str(e)}", {
                 "author_names": author_names,
                 "chart_type": chart_type
             })
-            await mcp_logger.log_api_response("generate_multi_author_chart", False, duration_ms, {"error": str(e)})
             
             return {
                 "success": False,
@@ -211,82 +860,188 @@ class RealMCPServer:
                 "mcp_enabled": self.is_real_mcp_available()
             }
     
-    async def parse_chart_command_with_ai(self, command: str) -> Dict[str, Any]:
+    async def _stream_message(self, prompt: Union[str, List[Dict[str, Any]]], max_tokens: int,
+                              stop_after_code_block: bool = False,
+                              stop_after_json_object: bool = False,
+                              system: Optional[List[Dict[str, Any]]] = None) -> str:
         """
-        AI를 사용해서 자연어 명령 파싱 (실제 MCP)
+        스트리밍으로 AI 응답 수신
+        
+        응답을 받는 대로 누적하며, stop_after_code_block이 True이면
+        첫 코드 블록(```...```)이 닫히는 즉시 스트림을 종료해 나머지 설명 텍스트를 기다리지 않습니다.
+        stop_after_json_object가 True이면 첫 JSON 객체가 닫히는 즉시 종료하고 그 객체만 반환합니다.
+        
+        Args:
+            prompt (str | List[dict]): 사용자 프롬프트 (문자열 또는 content 블록 리스트)
+            max_tokens (int): 최대 응답 토큰 수
+            stop_after_code_block (bool): 코드 블록 종료 시 조기 종료 여부
+            stop_after_json_object (bool): JSON 객체 종료 시 조기 종료 여부
+            system (List[dict]): 시스템 프롬프트 content 블록 (선택)
+            
+        Returns:
+            str: 앞뒤 공백이 제거된 응답 텍스트 (JSON 객체가 닫혔으면 해당 객체 텍스트)
         """
-        start_time = time.time()
+        response_text = ""
+        fence_count = 0
+        search_from = 0
+        json_scanner = _JsonObjectScanner() if stop_after_json_object else None
         
-        await mcp_logger.log_api_call("parse_chart_command", {"command": command})
+        request = {
+            "model": self._model,
+            "max_tokens": max_tokens,
+            "messages": [{"role": "user", "content": prompt}]
+        }
+        if system is not None:
+            request["system"] = system
         
-        if not self.is_real_mcp_available():
-            # 시뮬레이션 모드로 폴백
-            await log_mcp_warning("parsing", "API 키 미설정으로 시뮬레이션 모드로 전환")
-            return await self._parse_chart_command_fallback(command)
+        async with self._get_api_sem():
+            async with self.client.messages.stream(**request) as stream:
+                async for text in stream.text_stream:
+                    response_text += text
+                    if json_scanner is not None:
+                        if json_scanner.feed(response_text):
+                            return response_text[json_scanner.start:json_scanner.end]
+                        continue
+                    if not stop_after_code_block:
+                        continue
+                    
+                    # 새로 받은 부분에서만 ``` 검색 (청크 경계에 걸친 경우를 위해 2글자 겹침)
+                    fence_pos = response_text.find("```", search_from)
+                    while fence_pos != -1:
+                        fence_count += 1
+                        search_from = fence_pos + 3
+                        fence_pos = response_text.find("```", search_from)
+                    search_from = max(search_from, len(response_text) - 2)
+                    
+                    if fence_count >= 2:
+                        break
+        
+        return response_text.strip()
+    
+    def _get_cached_intent(self, key: str, cache: Optional[OrderedDict] = None) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 명령 파싱 결과 조회
+        
+        만료된 항목을 먼저 정리한 뒤 조회하며, 캐시가 오염되지 않도록 결과의 복사본을 반환합니다.
+        정규식 폴백 결과는 INTENT_CACHE_FALLBACK_TTL, AI 결과는 INTENT_CACHE_TTL 동안 유효합니다.
+        
+        Args:
+            key (str): 정규화된 명령 문자열
+            cache (OrderedDict): 조회할 캐시 (기본값: 차트 명령 캐시)
+            
+        Returns:
+            dict: {"result", "source", "ts"} 형태의 캐시 항목 (없으면 None)
+        """
+        if cache is None:
+            cache = self._intent_cache
+        
+        now = time.time()
+        expired = [
+            k for k, entry in cache.items()
+            if now - entry["ts"] > (INTENT_CACHE_FALLBACK_TTL if entry["source"] == "regex" else INTENT_CACHE_TTL)
+        ]
+        for k in expired:
+            del cache[k]
+        
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        
+        cache.move_to_end(key)
+        return {**entry, "result": copy.deepcopy(entry["result"])}
+    
+    def _store_intent(self, key: str, result: Dict[str, Any], source: str = "ai", cache: Optional[OrderedDict] = None):
+        """
+        명령 파싱 결과를 캐시에 저장
+        
+        신뢰도가 INTENT_CACHE_MIN_CONFIDENCE 미만인 결과는 저장하지 않습니다.
+        
+        Args:
+            key (str): 정규화된 명령 문자열
+            result (dict): 저장할 파싱 결과
+            source (str): 결과 출처 ("ai" 또는 "regex")
+            cache (OrderedDict): 저장할 캐시 (기본값: 차트 명령 캐시)
+        """
+        if result.get("confidence", 0) < INTENT_CACHE_MIN_CONFIDENCE:
+            return
+        
+        if cache is None:
+            cache = self._intent_cache
         
+        cache[key] = {"result": copy.deepcopy(result), "source": source, "ts": time.time()}
+        cache.move_to_end(key)
+        while len(cache) > INTENT_CACHE_MAX_SIZE:
+            cache.popitem(last=False)
+    
+    async def _upgrade_intent(self, command: str, cache_key: str):
+        """정규식 폴백으로 캐시된 명령을 AI로 다시 파싱해 캐시 갱신 (백그라운드용)"""
         try:
-            prompt = f"""
-다음 한국어 명령을 분석해서 차트 생성 정보를 추출해주세요:
-
-명령: "{command}"
-
-다음 JSON 형식으로 응답해주세요:
-{{
-    "author_names": ["작성자1", "작성자2"] 또는 null (여러 작성자 또는 없으면 null),
-    "author_name": "단일 작성자명 (호환성용, 없으면 null)",
-    "chart_type": "bar|line|pie|doughnut 중 하나",
-    "valid": true/false,
-    "confidence": 0.0-1.0,
-    "explanation": "파싱 결과 설명",
-    "is_multi_author": true/false
-}}
-
-차트 타입 매핑:
-- 막대, 바, 막대그래프, 바차트 → "bar"
-- 선그래프, 라인, 선형, 꺾은선 → "line"  
-- 원그래프, 파이, 원형 → "pie"
-- 도넛, 도너츠 → "doughnut"
-
-작성자명 추출 규칙:
-- 단일: "홍길동의", "김철수님의", "이영희 데이터" → author_name: "홍길동", is_multi_author: false
-- 다중: "홍길동과 김철수", "홍길동, 김철수의", "홍길동 김철수 데이터" → author_names: ["홍길동", "김철수"], is_multi_author: true
-- 전체: "모든 사람들", "전체", "모든 작성자", "모두", "모든 사람" → author_names: "ALL_AUTHORS", is_multi_author: true
-- 없음: 작성자 언급 없음 → author_names: null, author_name: null, is_multi_author: false
-
-특별 처리:
-- "모든 사람들", "전체", "모든 작성자" 등의 표현은 author_names: "ALL_AUTHORS"로 설정
-- 여러 작성자가 감지되면 is_multi_author를 true로, author_names 배열에 모든 작성자를 포함하세요.
-"""
+            await self.parse_chart_command_with_ai(command, use_cache=False)
+        finally:
+            self._intent_upgrades.discard(cache_key)
+    
+    async def _parse_chart_command_fallback_cached(self, command: str, cache_key: str) -> Dict[str, Any]:
+        """정규식 폴백으로 파싱하고 결과를 짧은 TTL로 캐시"""
+        result = await self._parse_chart_command_fallback(command)
+        self._store_intent(cache_key, result, source="regex")
+        return result
+    
+    async def parse_chart_command_with_ai(self, command: str, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        AI를 사용해서 자연어 명령 파싱 (실제 MCP)
+        
+        같은 (정규화된) 명령에 대한 파싱 결과는 캐시되어 API를 다시 호출하지 않습니다.
+        AI 결과는 INTENT_CACHE_TTL, AI 실패 후의 정규식 폴백 결과는 INTENT_CACHE_FALLBACK_TTL 동안 유지되며,
+        폴백 결과가 조회되면 백그라운드에서 AI 재파싱을 시도해 캐시를 갱신합니다.
+        
+        Args:
+            command (str): 자연어 명령
+            use_cache (bool): 캐시 조회 여부 (False면 항상 AI 호출, 결과는 캐시에 저장)
+        """
+        start_time = time.perf_counter_ns()
+        
+        mcp_logger.log_api_call_nowait("parse_chart_command", {"command": command})
+        
+        if not self.is_real_mcp_available():
+            # 시뮬레이션 모드로 폴백
+            await log_mcp_warning("parsing", "API 키 미설정으로 시뮬레이션 모드로 전환")
+            return await self._parse_chart_command_fallback(command)
+        
+        # 캐시 확인
+        cache_key = _normalize_command(command)
+        cached = self._get_cached_intent(cache_key) if use_cache else None
+        if cached is not None:
+            if cached["source"] == "regex" and cache_key not in self._intent_upgrades:
+                self._intent_upgrades.add(cache_key)
+                self._spawn(self._upgrade_intent(command, cache_key))
+            
+            # 공백만 다른 명령이 같은 항목을 쓰므로 원본 명령은 현재 명령으로 교체
+            cached_result = cached["result"]
+            if "original_command" in cached_result:
+                cached_result["original_command"] = command
+            duration_ms = (time.perf_counter_ns() - start_time) / 1_000_000
+            mcp_logger.log_parsing_nowait(command, cached_result, duration_ms)
+            return cached_result
+        
+        try:
+            prompt = _cached_prompt(_PARSE_PROMPT_STATIC, f'명령: "{command}"')
 
-            response = await self.client.messages.create(
-                model=config.DEFAULT_MODEL,
-                max_tokens=500,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
-            )
-            
-            # AI 응답 파싱
-            ai_response = response.content[0].text.strip()
+            # 도구 호출을 강제해 구조화된 응답 수신 (JSON 문자열 파싱 불필요)
+            async with self._get_api_sem():
+                response = await self.client.messages.create(
+                    model=self._model,
+                    max_tokens=500,
+                    tools=[_PARSE_TOOL],
+                    tool_choice={"type": "tool", "name": _PARSE_TOOL["name"]},
+                    messages=[{"role": "user", "content": prompt}]
+                )
             
-            # JSON 추출 시도
             try:
-                # JSON 블록이 있는지 확인
-                if "```json" in ai_response:
-                    json_start = ai_response.find("```json") + 7
-                    json_end = ai_response.find("```", json_start)
-                    json_content = ai_response[json_start:json_end].strip()
-                elif "{" in ai_response and "}" in ai_response:
-                    json_start = ai_response.find("{")
-                    json_end = ai_response.rfind("}") + 1
-                    json_content = ai_response[json_start:json_end]
-                else:
-                    raise ValueError("JSON 형식을 찾을 수 없습니다")
+                tool_use = next((block for block in response.content if block.type == "tool_use"), None)
+                if tool_use is None:
+                    raise ValueError("도구 호출 응답을 찾을 수 없습니다")
                 
-                parsed_result = json.loads(json_content)
+                parsed_result = tool_use.input
                 
                 # 결과 검증 및 보완
                 author_names = parsed_result.get("author_names")
@@ -318,103 +1073,75 @@ class RealMCPServer:
                 
                 print(f"🤖 AI 파싱 결과: {result}")
                 
+                # 캐시에 저장
+                self._store_intent(cache_key, result)
+                
                 # 로그 기록
-                duration_ms = (time.time() - start_time) * 1000
-                await mcp_logger.log_parsing(command, result, duration_ms)
-                await mcp_logger.log_api_response("parse_chart_command", True, duration_ms, result)
+                duration_ms = (time.perf_counter_ns() - start_time) / 1_000_000
+                mcp_logger.log_request_complete_nowait("parse_chart_command", True, duration_ms, {
+                    "command": command, **result
+                }, category="parsing")
                 
                 return result
                 
-            except (json.JSONDecodeError, KeyError, ValueError) as e:
+            except (KeyError, ValueError) as e:
+                ai_response = str(response.content)
                 print(f"⚠️ AI 응답 파싱 실패: {e}")
                 print(f"AI 응답: {ai_response}")
                 
                 # 로그 기록
-                duration_ms = (time.time() - start_time) * 1000
+                duration_ms = (time.perf_counter_ns() - start_time) / 1_000_000
                 await mcp_logger.log_error("parsing", f"AI 응답 파싱 실패: {str(e)}", {"ai_response": ai_response[:200]})
-                await mcp_logger.log_api_response("parse_chart_command", False, duration_ms, {"error": str(e)})
+                mcp_logger.log_api_response_nowait("parse_chart_command", False, duration_ms, {"error": str(e)})
                 
                 # 폴백으로 기존 방식 사용
-                return await self._parse_chart_command_fallback(command)
+                return await self._parse_chart_command_fallback_cached(command, cache_key)
                 
         except Exception as e:
             print(f"❌ AI 명령 파싱 중 오류: {e}")
             
             # 로그 기록
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_time) / 1_000_000
             await mcp_logger.log_error("parsing", f"AI 파싱 실패: {str(e)}")
-            await mcp_logger.log_api_response("parse_chart_command", False, duration_ms, {"error": str(e)})
+            mcp_logger.log_api_response_nowait("parse_chart_command", False, duration_ms, {"error": str(e)})
             
             # 폴백으로 기존 방식 사용
-            return await self._parse_chart_command_fallback(command)
+            return await self._parse_chart_command_fallback_cached(command, cache_key)
     
     async def _parse_chart_command_fallback(self, command: str) -> Dict[str, Any]:
         """기존 정규표현식 방식으로 폴백"""
         try:
             command = command.strip()
             
-            # 작성자명 추출 패턴들
-            author_patterns = [
-                r'(\w+)의\s*(?:데이터|값|수치|글)',
-                r'(\w+)\s*작성자',
-                r'(\w+)\s*님',
-                r'"([^"]+)"',
-                r"'([^']+)'",
-            ]
-            
+            # 작성자명 추출
             author_name = None
-            for pattern in author_patterns:
-                match = re.search(pattern, command)
+            for pattern in _AUTHOR_PATTERNS:
+                match = pattern.search(command)
                 if match:
                     author_name = match.group(1).strip()
                     break
             
-            # 차트 타입 추출
-            chart_type = "bar"
-            chart_type_keywords = {
-                "line": ["선그래프", "라인", "선형", "꺾은선"],
-                "pie": ["원그래프", "파이", "원형"],
-                "doughnut": ["도넛", "도너츠"],
-                "bar": ["막대", "바", "막대그래프", "바차트"]
+            # 차트 타입 추출 (한 번의 스캔으로 키워드를 찾고 우선순위가 가장 높은 타입 선택)
+            matched_types = {
+                _CHART_KEYWORD_TYPES[match.group().lower()]
+                for match in _CHART_KEYWORD_RE.finditer(command)
             }
-            
-            command_lower = command.lower()
-            for ctype, keywords in chart_type_keywords.items():
-                for keyword in keywords:
-                    if keyword in command or keyword in command_lower:
-                        chart_type = ctype
-                        break
-                if chart_type != "bar":
-                    break
-            
-            # "모든 사람들" 관련 표현 감지
-            all_authors_patterns = [
-                r'모든\s*사람들?',
-                r'전체\s*(?:사람들?|작성자|데이터)',
-                r'모든\s*작성자',
-                r'모두(?:\s*데이터|의)?',
-                r'전부(?:\s*데이터|의)?'
-            ]
+            chart_type = min(matched_types, key=_CHART_TYPE_PRIORITY.get, default="bar")
             
             author_names = []
             is_multi_author = False
             
             # 먼저 "모든 사람들" 패턴 확인
-            for pattern in all_authors_patterns:
-                if re.search(pattern, command):
+            for pattern in _ALL_AUTHORS_PATTERNS:
+                if pattern.search(command):
                     author_names = "ALL_AUTHORS"
                     is_multi_author = True
                     break
             
             # "모든 사람들"이 아닌 경우 다중 작성자 감지 시도
             if not is_multi_author:
-                multi_author_patterns = [
-                    r'(\w+)(?:과|와|,)\s*(\w+)',  # "홍길동과 김철수"
-                    r'(\w+)\s+(\w+)(?:\s+데이터|의)',  # "홍길동 김철수 데이터"
-                ]
-                
-                for pattern in multi_author_patterns:
-                    matches = re.findall(pattern, command)
+                for pattern in _MULTI_AUTHOR_PATTERNS:
+                    matches = pattern.findall(command)
                     if matches:
                         for match in matches:
                             author_names.extend([name.strip() for name in match if name.strip()])
@@ -457,9 +1184,140 @@ class RealMCPServer:
                 "is_multi_author": False
             }
     
+    def _build_chart_prompt(self, author_data: List[Dict], chart_type: str, author_name: str) -> List[Dict[str, Any]]:
+        """단일 작성자 Chart.js 코드 생성용 프롬프트 구성"""
+        # 데이터 준비 (수치가 없는 게시글은 라벨과 값 모두에서 제외해 순서를 맞춤)
+        labels, values = [], []
+        for post in author_data:
+            value = post['numeric_value']
+            if value is None:
+                continue
+            labels.append(post['title'])
+            values.append(value)
+        
+        if not values:
+            labels, values = [""], [0]
+        
+        return _cached_prompt(
+            _CHART_PROMPT_STATIC,
+            f"작성자: {author_name}\n"
+            f"차트 타입: {chart_type}\n"
+            f"라벨: {labels}\n"
+            f"값: {values}"
+        )
+    
+    @staticmethod
+    def _extract_chart_code(ai_response: str) -> str:
+        """AI 응답에서 JavaScript 코드 블록 추출 (코드 블록이 없으면 응답 전체)"""
+        match = _JS_FENCE_RE.search(ai_response)
+        return (match.group(1) if match else ai_response).strip()
+    
+    async def _run_message_batch(self, requests: List[Tuple[Union[str, List[Dict[str, Any]]], int]]) -> List[Optional[str]]:
+        """
+        Message Batches API로 여러 프롬프트를 한 번에 처리
+        
+        배치는 일반 호출보다 비용이 낮지만 완료까지 시간이 걸리므로
+        대시보드 생성 같은 비대화형 작업에만 사용합니다.
+        
+        Args:
+            requests (List[Tuple]): (프롬프트 또는 content 블록 리스트, max_tokens) 리스트
+            
+        Returns:
+            List[Optional[str]]: 요청 순서대로의 응답 텍스트 (실패한 요청은 None)
+        """
+        async with self._get_api_sem():
+            batch = await self.client.beta.messages.batches.create(
+                requests=[
+                    {
+                        "custom_id": f"chart-{i}",
+                        "params": {
+                            "model": self._model,
+                            "max_tokens": max_tokens,
+                            "messages": [{"role": "user", "content": prompt}]
+                        }
+                    }
+                    for i, (prompt, max_tokens) in enumerate(requests)
+                ]
+            )
+        
+        # 배치 완료까지 폴링 (지수 백오프)
+        interval = BATCH_POLL_INTERVAL
+        while batch.processing_status != "ended":
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, BATCH_POLL_MAX_INTERVAL)
+            batch = await self.client.beta.messages.batches.retrieve(batch.id)
+        
+        # 결과는 요청 순서와 무관하게 오므로 custom_id로 정렬
+        texts: List[Optional[str]] = [None] * len(requests)
+        async for entry in await self.client.beta.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                index = int(entry.custom_id.split("-")[1])
+                texts[index] = entry.result.message.content[0].text.strip()
+        
+        return texts
+    
+    async def generate_charts_batch(self, jobs: List[Tuple[List[Dict], str, str]]) -> List[Dict[str, Any]]:
+        """
+        여러 단일 작성자 차트 코드를 Message Batches API로 일괄 생성
+        
+        결과가 나오기까지 수 분이 걸릴 수 있어 웹 엔드포인트에서는 사용하지 않으며,
+        비대화형 일괄 작업(스크립트 등)을 위한 공개 API입니다.
+        
+        Args:
+            jobs (List[Tuple[List[Dict], str, str]]): (작성자 데이터, 차트 타입, 작성자명) 리스트
+            
+        Returns:
+            List[dict]: 작업 순서대로의 차트 생성 결과 (generate_chart_code_with_ai와 같은 형태)
+        """
+        if not jobs:
+            return []
+        
+        if not self.is_real_mcp_available():
+            # 시뮬레이션 모드로 폴백
+            return [
+                {
+                    "success": True,
+                    "chart_code": self.chart_gen.create_chart_js_code(author_data, chart_type),
+                    "method": "fallback",
+                    "message": "시뮬레이션 모드로 차트 생성됨"
+                }
+                for author_data, chart_type, _ in jobs
+            ]
+        
+        try:
+            texts = await self._run_message_batch([
+                (self._build_chart_prompt(author_data, chart_type, author_name), 1500)
+                for author_data, chart_type, author_name in jobs
+            ])
+        except Exception as e:
+            print(f"❌ AI 배치 차트 코드 생성 실패: {e}")
+            texts = [None] * len(jobs)
+        
+        results = []
+        for (author_data, chart_type, _), ai_response in zip(jobs, texts):
+            if ai_response is None:
+                # 실패한 작업은 기존 방식으로 생성
+                results.append({
+                    "success": True,
+                    "chart_code": self.chart_gen.create_chart_js_code(author_data, chart_type),
+                    "method": "fallback_after_ai_error",
+                    "message": "AI 배치 생성 실패로 기본 차트 생성됨"
+                })
+            else:
+                results.append({
+                    "success": True,
+                    "chart_code": self._extract_chart_code(ai_response),
+                    "method": "ai_generated",
+                    "message": f"AI가 {chart_type} 차트 코드를 생성했습니다"
+                })
+        
+        return results
+    
     async def generate_chart_code_with_ai(self, author_data: List[Dict], chart_type: str, author_name: str) -> Dict[str, Any]:
         """
         AI를 사용해서 Chart.js 코드 생성 (실제 MCP)
+        
+        같은 데이터로 동시에 들어온 요청은 하나의 API 호출 결과를 함께 사용합니다.
         """
         if not self.is_real_mcp_available():
             # 시뮬레이션 모드로 폴백
@@ -472,74 +1330,23 @@ class RealMCPServer:
             }
         
         try:
-            # 데이터 준비
-            labels = [post['title'] for post in author_data]
-            values = [post['numeric_value'] for post in author_data if post['numeric_value'] is not None]
-            
-            if not values:
-                values = [0] * len(labels)
-            
-            prompt = f"""
-다음 데이터로 Chart.js 코드를 생성해주세요:
-
-작성자: {author_name}
-차트 타입: {chart_type}
-라벨: {labels}
-값: {values}
-
-요구사항:
-1. Chart.js 3.x 문법 사용
-2. 기존 차트 제거 코드 포함 (window.myChart 확인)
-3. 반응형 디자인
-4. 한국어 제목과 라벨
-5. 아름다운 색상 조합
-6. 캔버스 ID는 'dynamicChart' 사용
-
-다음 형식으로 완전한 JavaScript 코드를 생성해주세요:
-```javascript
-// 기존 차트 제거
-if (window.myChart) {{
-    window.myChart.destroy();
-}}
-
-// 새 차트 생성
-const ctx = document.getElementById('dynamicChart').getContext('2d');
-window.myChart = new Chart(ctx, {{
-    // 차트 설정...
-}});
-```
-
-응답은 JavaScript 코드만 반환해주세요.
-"""
-
-            response = await self.client.messages.create(
-                model=config.DEFAULT_MODEL,
-                max_tokens=1500,
-                messages=[
-                    {
-                        "role": "user", 
-                        "content": prompt
-                    }
-                ]
-            )
+            prompt = self._build_chart_prompt(author_data, chart_type, author_name)
+            
+            # 같은 프롬프트로 진행 중인 요청이 있으면 그 응답을 기다림
+            request_key = prompt[-1]["text"]
+            pending = self._chart_requests.get(request_key)
+            if pending is None:
+                pending = asyncio.ensure_future(
+                    self._stream_message(prompt, max_tokens=1500, stop_after_code_block=True)
+                )
+                self._chart_requests[request_key] = pending
+                pending.add_done_callback(lambda _: self._chart_requests.pop(request_key, None))
             
-            ai_response = response.content[0].text.strip()
+            # 한 호출자가 취소되어도 다른 호출자가 기다리는 요청은 계속 진행
+            ai_response = await asyncio.shield(pending)
             
             # JavaScript 코드 추출
-            if "```javascript" in ai_response:
-                code_start = ai_response.find("```javascript") + 13
-                code_end = ai_response.find("```", code_start)
-                chart_code = ai_response[code_start:code_end].strip()
-            elif "```js" in ai_response:
-                code_start = ai_response.find("```js") + 5
-                code_end = ai_response.find("```", code_start)
-                chart_code = ai_response[code_start:code_end].strip()
-            elif "```" in ai_response:
-                code_start = ai_response.find("```") + 3
-                code_end = ai_response.find("```", code_start)
-                chart_code = ai_response[code_start:code_end].strip()
-            else:
-                chart_code = ai_response
+            chart_code = self._extract_chart_code(ai_response)
             
             print(f"🤖 AI가 생성한 차트 코드 길이: {len(chart_code)} 문자")
             
@@ -561,9 +1368,44 @@ window.myChart = new Chart(ctx, {{
                 "message": f"AI 생성 실패로 기본 차트 생성됨: {str(e)}"
             }
     
-    async def generate_multi_author_chart_code(self, author_data: List[Dict], chart_type: str, author_names: List[str]) -> Dict[str, Any]:
+    async def generate_author_charts_concurrent(self, specs: List[Tuple[List[Dict], str, str]]) -> List[Dict[str, Any]]:
+        """
+        여러 단일 작성자 차트 코드를 동시에 생성
+        
+        각 작업의 API 호출은 동시에 진행되며, 동시 호출 수는 _get_api_sem()의 세마포어로 제한됩니다.
+        한 작업이 실패하거나 취소되어도 나머지 결과에는 영향을 주지 않습니다.
+        
+        웹 엔드포인트에서는 사용하지 않으며, 여러 차트를 한 번에 만드는 외부 호출자(스크립트 등)용 공개 API입니다.
+        
+        Args:
+            specs (List[Tuple[List[Dict], str, str]]): (작성자 데이터, 차트 타입, 작성자명) 리스트
+            
+        Returns:
+            List[dict]: 작업 순서대로의 차트 생성 결과 (generate_chart_code_with_ai와 같은 형태)
+        """
+        results = await asyncio.gather(
+            *(self.generate_chart_code_with_ai(author_data, chart_type, author_name)
+              for author_data, chart_type, author_name in specs),
+            return_exceptions=True
+        )
+        
+        # 예외로 끝나거나 취소된 작업만 실패 결과로 변환 (CancelledError는 Exception이 아닌 BaseException)
+        return [
+            result if not isinstance(result, BaseException) else {
+                "success": False,
+                "chart_code": None,
+                "method": "error",
+                "message": f"{author_name} 차트 생성 중 오류가 발생했습니다: {str(result)}"
+            }
+            for (_, _, author_name), result in zip(specs, results)
+        ]
+    
+    async def generate_multi_author_chart_code(self, author_data: PostBatch, chart_type: str, author_names: List[str], batch_mode: bool = False) -> Dict[str, Any]:
         """
         AI를 사용해서 다중 작성자 Chart.js 코드 생성
+        
+        batch_mode가 True이면 Message Batches API를 사용합니다.
+        웹 엔드포인트는 항상 batch_mode=False로 호출하며, True는 비대화형 작업을 하는 외부 호출자용입니다.
         """
         if not self.is_real_mcp_available():
             # 시뮬레이션 모드로 폴백
@@ -576,81 +1418,42 @@ window.myChart = new Chart(ctx, {{
             }
         
         try:
-            # 작성자별 데이터 그룹화
-            author_groups = {}
-            for post in author_data:
-                author = post.get('author', 'Unknown')
-                if author not in author_groups:
-                    author_groups[author] = []
-                author_groups[author].append(post)
-            
             # 차트 데이터 준비
             if chart_type in ['pie', 'doughnut']:
                 # 원형/도넛 차트: 작성자별 총합
-                labels = list(author_groups.keys())
-                values = [sum(post['numeric_value'] for post in posts if post['numeric_value'] is not None) 
-                         for posts in author_groups.values()]
+                author_values = author_data.values_by_author()
+                labels = list(author_values.keys())
+                values = [sum(value for value in author_vals if value is not None)
+                         for author_vals in author_values.values()]
             else:
-                # 막대/선형 차트: 각 게시글별
-                labels = [f"{post['author']}: {post['title']}" for post in author_data]
-                values = [post['numeric_value'] for post in author_data if post['numeric_value'] is not None]
+                # 막대/선형 차트: 각 게시글별 (수치가 없는 게시글은 라벨과 값 모두에서 제외)
+                labels, values = [], []
+                for author, title, value in author_data.rows():
+                    if value is None:
+                        continue
+                    labels.append(f"{author}: {title}")
+                    values.append(value)
             
             if not values:
-                values = [0] * len(labels)
-            
-            prompt = f"""
-다음 다중 작성자 데이터로 Chart.js 코드를 생성해주세요:
-
-작성자들: {', '.join(author_names)}
-차트 타입: {chart_type}
-라벨: {labels[:10]}...  # 처음 10개만 표시
-값: {values[:10]}...
-
-요구사항:
-1. Chart.js 3.x 문법 사용
-2. 기존 차트 제거 코드 포함 (window.myChart 확인)
-3. 다중 작성자를 구분할 수 있는 색상 사용
-4. 반응형 디자인
-5. 한국어 제목과 라벨
-6. 각 작성자별 구분되는 색상
-7. 범례 표시
-8. 캔버스 ID는 'dynamicChart' 사용
-
-{chart_type} 차트의 경우:
-- pie/doughnut: 작성자별 총합으로 표시
-- bar/line: 모든 게시글을 작성자별 색상으로 구분
-
-응답은 JavaScript 코드만 반환해주세요.
-"""
-
-            response = await self.client.messages.create(
-                model=config.DEFAULT_MODEL,
-                max_tokens=2000,
-                messages=[
-                    {
-                        "role": "user", 
-                        "content": prompt
-                    }
-                ]
+                labels, values = [""], [0]
+            
+            prompt = _cached_prompt(
+                _MULTI_CHART_PROMPT_STATIC,
+                f"작성자들: {', '.join(author_names)}\n"
+                f"차트 타입: {chart_type}\n"
+                f"라벨: {labels[:10]}...  # 처음 10개만 표시\n"
+                f"값: {values[:10]}..."
             )
-            
-            ai_response = response.content[0].text.strip()
+
+            if batch_mode:
+                ai_response = (await self._run_message_batch([(prompt, 2000)]))[0]
+                if ai_response is None:
+                    raise RuntimeError("배치 요청이 실패했습니다")
+            else:
+                ai_response = await self._stream_message(prompt, max_tokens=2000, stop_after_code_block=True)
             
             # JavaScript 코드 추출
-            if "```javascript" in ai_response:
-                code_start = ai_response.find("```javascript") + 13
-                code_end = ai_response.find("```", code_start)
-                chart_code = ai_response[code_start:code_end].strip()
-            elif "```js" in ai_response:
-                code_start = ai_response.find("```js") + 5
-                code_end = ai_response.find("```", code_start)
-                chart_code = ai_response[code_start:code_end].strip()
-            elif "```" in ai_response:
-                code_start = ai_response.find("```") + 3
-                code_end = ai_response.find("```", code_start)
-                chart_code = ai_response[code_start:code_end].strip()
-            else:
-                chart_code = ai_response
+            chart_code = self._extract_chart_code(ai_response)
             
             print(f"🤖 AI가 생성한 다중 작성자 차트 코드 길이: {len(chart_code)} 문자")
             
@@ -672,125 +1475,49 @@ window.myChart = new Chart(ctx, {{
                 "message": f"AI 생성 실패로 기본 다중 작성자 차트 생성됨: {str(e)}"
             }
     
-    def _create_multi_author_chart_fallback(self, author_data: List[Dict], chart_type: str, author_names: List[str]) -> str:
+    def _create_multi_author_chart_fallback(self, author_data: PostBatch, chart_type: str, author_names: List[str]) -> str:
         """다중 작성자 차트 코드 생성 (폴백)"""
-        import json
-        
-        # 작성자별 데이터 그룹화
-        author_groups = {}
-        for post in author_data:
-            author = post.get('author', 'Unknown')
-            if author not in author_groups:
-                author_groups[author] = []
-            author_groups[author].append(post)
-        
-        # 색상 팔레트
-        colors = [
-            'rgba(255, 99, 132, 0.8)',
-            'rgba(54, 162, 235, 0.8)',
-            'rgba(255, 205, 86, 0.8)',
-            'rgba(75, 192, 192, 0.8)',
-            'rgba(153, 102, 255, 0.8)',
-            'rgba(255, 159, 64, 0.8)',
-            'rgba(199, 199, 199, 0.8)',
-            'rgba(83, 102, 255, 0.8)'
-        ]
+        # 작성자별 값 그룹화
+        author_values = author_data.values_by_author()
         
         if chart_type in ['pie', 'doughnut']:
             # 원형 차트: 작성자별 총합
-            labels = list(author_groups.keys())
-            values = [sum(post['numeric_value'] for post in posts if post['numeric_value'] is not None) 
-                     for posts in author_groups.values()]
-            background_colors = colors[:len(labels)]
-            
-            chart_code = f"""
-            if (window.myChart) {{
-                window.myChart.destroy();
-            }}
-            
-            const ctx = document.getElementById('dynamicChart').getContext('2d');
-            window.myChart = new Chart(ctx, {{
-                type: '{chart_type}',
-                data: {{
-                    labels: {json.dumps(labels, ensure_ascii=False)},
-                    datasets: [{{
-                        data: {json.dumps(values)},
-                        backgroundColor: {json.dumps(background_colors)},
-                        borderWidth: 2
-                    }}]
-                }},
-                options: {{
-                    responsive: true,
-                    plugins: {{
-                        title: {{
-                            display: true,
-                            text: '다중 작성자 데이터 차트 ({", ".join(author_names)})'
-                        }},
-                        legend: {{
-                            display: true,
-                            position: 'bottom'
-                        }}
-                    }}
-                }}
-            }});
-            """
+            labels = list(author_values.keys())
+            values = [sum(value for value in author_vals if value is not None)
+                     for author_vals in author_values.values()]
+            background_colors = _CHART_COLORS[:len(labels)]
+            
+            chart_code = _PIE_CHART_TEMPLATE.substitute(
+                chart_type=chart_type,
+                labels=orjson.dumps(labels).decode(),
+                values=orjson.dumps(values).decode(),
+                background_colors=orjson.dumps(background_colors).decode(),
+                authors=", ".join(author_names)
+            )
         else:
             # 막대/선형 차트: 데이터셋별 작성자 구분
             datasets = []
-            for i, (author, posts) in enumerate(author_groups.items()):
-                labels_for_author = [post['title'] for post in posts]
-                values_for_author = [post['numeric_value'] for post in posts if post['numeric_value'] is not None]
+            for i, (author, author_vals) in enumerate(author_values.items()):
+                values_for_author = [value for value in author_vals if value is not None]
                 
                 datasets.append({
                     "label": author,
                     "data": values_for_author,
-                    "backgroundColor": colors[i % len(colors)],
-                    "borderColor": colors[i % len(colors)].replace('0.8', '1'),
+                    "backgroundColor": _CHART_COLORS[i % len(_CHART_COLORS)],
+                    "borderColor": _CHART_COLORS[i % len(_CHART_COLORS)].replace('0.8', '1'),
                     "borderWidth": 2
                 })
             
-            all_labels = [post['title'] for post in author_data]
-            
-            chart_code = f"""
-            if (window.myChart) {{
-                window.myChart.destroy();
-            }}
-            
-            const ctx = document.getElementById('dynamicChart').getContext('2d');
-            window.myChart = new Chart(ctx, {{
-                type: '{chart_type}',
-                data: {{
-                    labels: {json.dumps(all_labels, ensure_ascii=False)},
-                    datasets: {json.dumps(datasets, ensure_ascii=False)}
-                }},
-                options: {{
-                    responsive: true,
-                    plugins: {{
-                        title: {{
-                            display: true,
-                            text: '다중 작성자 데이터 차트 ({", ".join(author_names)})'
-                        }},
-                        legend: {{
-                            display: true,
-                            position: 'top'
-                        }}
-                    }},
-                    scales: {{
-                        y: {{
-                            beginAtZero: true,
-                            title: {{
-                                display: true,
-                                text: '값'
-                            }}
-                        }}
-                    }}
-                }}
-            }});
-            """
+            chart_code = _BAR_CHART_TEMPLATE.substitute(
+                chart_type=chart_type,
+                labels=orjson.dumps(author_data.titles).decode(),
+                datasets=orjson.dumps(datasets).decode(),
+                authors=", ".join(author_names)
+            )
         
         return chart_code
     
-    def _generate_multi_author_summary(self, author_names: List[str], all_data: List[Dict]) -> Dict[str, Any]:
+    def _generate_multi_author_summary(self, author_names: List[str], all_data: PostBatch) -> Dict[str, Any]:
         """다중 작성자 요약 정보 생성"""
         if not all_data:
             return {
@@ -802,29 +1529,46 @@ window.myChart = new Chart(ctx, {{
                 "author_breakdown": {}
             }
         
+        # 한 번의 순회로 작성자별/전체 합계, 개수, 최대/최소값 집계
+        groups = defaultdict(lambda: {"posts": 0, "sum": 0, "count": 0, "max": None, "min": None})
+        total_sum = 0
+        total_count = 0
+        for author, value in zip(all_data.authors, all_data.values):
+            group = groups[author]
+            group["posts"] += 1
+            
+            if value is None:
+                continue
+            
+            group["sum"] += value
+            group["count"] += 1
+            if group["max"] is None or value > group["max"]:
+                group["max"] = value
+            if group["min"] is None or value < group["min"]:
+                group["min"] = value
+            total_sum += value
+            total_count += 1
+        
         # 작성자별 통계
         author_stats = {}
         for author in author_names:
-            author_posts = [post for post in all_data if post.get('author') == author]
-            values = [post['numeric_value'] for post in author_posts if post['numeric_value'] is not None]
+            group = groups.get(author)
+            has_values = group is not None and group["count"] > 0
             
             author_stats[author] = {
-                "posts": len(author_posts),
-                "total_value": round(sum(values), 2) if values else 0,
-                "average_value": round(sum(values) / len(values), 2) if values else 0,
-                "max_value": max(values) if values else 0,
-                "min_value": min(values) if values else 0
+                "posts": group["posts"] if group else 0,
+                "total_value": round(group["sum"], 2) if has_values else 0,
+                "average_value": round(group["sum"] / group["count"], 2) if has_values else 0,
+                "max_value": group["max"] if has_values else 0,
+                "min_value": group["min"] if has_values else 0
             }
         
-        # 전체 통계
-        all_values = [post['numeric_value'] for post in all_data if post['numeric_value'] is not None]
-        
         return {
             "authors": author_names,
             "total_authors": len(author_names),
             "total_posts": len(all_data),
-            "total_value": round(sum(all_values), 2) if all_values else 0,
-            "average_value": round(sum(all_values) / len(all_values), 2) if all_values else 0,
+            "total_value": round(total_sum, 2) if total_count else 0,
+            "average_value": round(total_sum / total_count, 2) if total_count else 0,
             "author_breakdown": author_stats
             }
     
@@ -832,9 +1576,9 @@ window.myChart = new Chart(ctx, {{
         """
         통합 차트 생성 메서드 (AI + 기존 로직)
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
-        await mcp_logger.log_api_call("generate_author_chart", {
+        mcp_logger.log_api_call_nowait("generate_author_chart", {
             "author_name": author_name,
             "chart_type": chart_type
         })
@@ -874,14 +1618,13 @@ window.myChart = new Chart(ctx, {{
             method_msg = "🤖 AI로 생성됨" if chart_result["method"] == "ai_generated" else "⚙️ 로컬로 생성됨"
             
             # 성공 로그 기록
-            duration_ms = (time.time() - start_time) * 1000
-            await mcp_logger.log_chart_generation(chart_type, [author_name], True, chart_result["method"], duration_ms)
-            await mcp_logger.log_api_response("generate_author_chart", True, duration_ms, {
-                "author_name": author_name,
+            duration_ms = (time.perf_counter_ns() - start_time) / 1_000_000
+            mcp_logger.log_request_complete_nowait("generate_author_chart", True, duration_ms, {
+                "author_names": [author_name],
                 "chart_type": chart_type,
                 "data_count": len(author_posts),
                 "method": chart_result["method"]
-            })
+            }, category="chart_generation")
             
             return {
                 "success": True,
@@ -895,13 +1638,17 @@ window.myChart = new Chart(ctx, {{
             
         except Exception as e:
             # 실패 로그 기록
-            duration_ms = (time.time() - start_time) * 1000
-            await mcp_logger.log_chart_generation(chart_type, [author_name], False, "error", duration_ms)
+            duration_ms = (time.perf_counter_ns() - start_time) / 1_000_000
+            mcp_logger.log_request_complete_nowait("generate_author_chart", False, duration_ms, {
+                "author_names": [author_name],
+                "chart_type": chart_type,
+                "method": "error",
+                "error": str(e)
+            }, category="chart_generation")
             await mcp_logger.log_error("chart_generation", f"차트 생성 실패: {str(e)}", {
                 "author_name": author_name,
                 "chart_type": chart_type
             })
-            await mcp_logger.log_api_response("generate_author_chart", False, duration_ms, {"error": str(e)})
             
             return {
                 "success": False,
@@ -917,18 +1664,19 @@ window.myChart = new Chart(ctx, {{
             "api_key_configured": config.is_api_key_configured(),
             "client_initialized": self.client is not None,
             "mcp_available": self.is_real_mcp_available(),
-            "model": config.DEFAULT_MODEL,
+            "model": self._model,
             "mode": "AI-Powered MCP" if self.is_real_mcp_available() else "Simulation Mode"
         }
         
         if self.is_real_mcp_available():
             try:
                 # 간단한 API 테스트
-                test_response = await self.client.messages.create(
-                    model=config.DEFAULT_MODEL,
-                    max_tokens=10,
-                    messages=[{"role": "user", "content": "안녕하세요"}]
-                )
+                async with self._get_api_sem():
+                    test_response = await self.client.messages.create(
+                        model=self._model,
+                        max_tokens=10,
+                        messages=[{"role": "user", "content": "안녕하세요"}]
+                    )
                 status["api_test"] = "✅ 성공"
                 status["api_response_length"] = len(test_response.content[0].text)
             except Exception as e:
@@ -938,39 +1686,67 @@ window.myChart = new Chart(ctx, {{
     
     # === 게시글 관리 MCP 기능들 ===
     
+    def invalidate_post_command(self, command: str):
+        """
+        게시글 관리 명령의 캐시된 파싱 결과 제거
+        
+        파싱 결과로 실행한 작업이 실패했을 때 호출해, 같은 명령을 다시 AI로 파싱하도록 합니다.
+        """
+        self._post_command_cache.pop(_post_command_cache_key(command), None)
+    
     async def parse_post_management_command(self, command: str) -> Dict[str, Any]:
         """
         게시글 관리 명령을 자연어로 파싱
         
+        같은 명령(앞뒤 공백 제외)에 대한 AI 파싱 결과는 INTENT_CACHE_TTL 동안 캐시되어
+        API를 다시 호출하지 않습니다.
+        
         Args:
             command (str): 자연어 게시글 관리 명령
             
         Returns:
             dict: 파싱된 결과
         """
-        start_time = time.time()
-        await mcp_logger.log_api_call("parse_post_management_command", {"command": command})
+        start_time = time.perf_counter_ns()
+        mcp_logger.log_api_call_nowait("parse_post_management_command", {"command": command})
         
         try:
             if self.is_real_mcp_available():
+                # 캐시 확인
+                cache_key = _post_command_cache_key(command)
+                cached = self._get_cached_intent(cache_key, self._post_command_cache)
+                
+                if cached is not None:
+                    result = cached["result"]
+                    result["original_command"] = command
+                    duration_ms = (time.perf_counter_ns() - start_time) / 1_000_000
+                    mcp_logger.log_parsing_nowait(command, result, duration_ms)
+                    return result
+                
                 # AI를 사용한 파싱
                 result = await self._parse_post_command_with_ai(command)
                 
+                # AI가 유효하다고 판단한 결과만 캐시 (폴백 결과는 다음에 다시 AI로 시도)
+                if result.get("method") == "ai_powered" and result.get("valid"):
+                    self._store_intent(cache_key, result, cache=self._post_command_cache)
+                
                 # 성공 로그 기록
-                duration_ms = (time.time() - start_time) * 1000
-                await mcp_logger.log_parsing(command, result, duration_ms)
-                await mcp_logger.log_api_response("parse_post_management_command", True, duration_ms, result)
+                duration_ms = (time.perf_counter_ns() - start_time) / 1_000_000
+                mcp_logger.log_request_complete_nowait("parse_post_management_command", True, duration_ms, {
+                    "command": command, **result
+                }, category="parsing")
                 
                 return result
             else:
                 # 정규표현식 기반 파싱 (fallback)
-                await mcp_logger.log("warning", "parsing", "API 키 미설정으로 시뮬레이션 모드로 전환")
+                await log_mcp_warning("parsing", "API 키 미설정으로 시뮬레이션 모드로 전환")
                 result = self._parse_post_command_fallback(command)
                 
                 # 성공 로그 기록
-                duration_ms = (time.time() - start_time) * 1000
-                await mcp_logger.log_parsing(command, result, duration_ms)
-                await mcp_logger.log_api_response("parse_post_management_command", True, duration_ms, result)
+                duration_ms = (time.perf_counter_ns() - start_time) / 1_000_000
+                mcp_logger.log_request_complete_nowait("parse_post_management_command", True, duration_ms, {
+                    "command": command, **result
+                }, category="parsing")
                 
                 return result
                 
@@ -979,8 +1755,8 @@ window.myChart = new Chart(ctx, {{
             print(f"❌ {error_msg}")
             
             # 오류 로그 기록
-            duration_ms = (time.time() - start_time) * 1000
-            await mcp_logger.log_parsing(command, {"valid": False, "error": str(e), "method": "error"}, duration_ms)
+            duration_ms = (time.perf_counter_ns() - start_time) / 1_000_000
+            mcp_logger.log_parsing_nowait(command, {"valid": False, "error": str(e), "method": "error"}, duration_ms)
             await mcp_logger.log_error("parsing", error_msg, {"command": command, "error": str(e)})
             
             return {
@@ -995,61 +1771,24 @@ window.myChart = new Chart(ctx, {{
     async def _parse_post_command_with_ai(self, command: str) -> Dict[str, Any]:
         """AI를 사용한 게시글 관리 명령 파싱"""
         try:
-            prompt = f"""
-다음 한국어 명령을 분석해서 게시글 관리 정보를 추출해주세요:
-
-명령: "{command}"
-
-다음 JSON 형식으로 응답해주세요:
-{{
-    "action": "create|update|delete|list 중 하나",
-    "post_id": 게시글ID (숫자, 수정/삭제시 필요, 없으면 null),
-    "author": "작성자명 (생성시 필요, 없으면 null)",
-    "title": "제목 (생성/수정시, 없으면 null)",
-    "content": "내용 (생성/수정시, 없으면 null)",
-    "numeric_value": 수치값 (숫자, 선택사항, 없으면 null),
-    "category": "카테고리 (선택사항, 없으면 null)",
-    "field_to_update": "수정할 필드명 (update시: title|content|author|numeric_value|category, 없으면 null)",
-    "new_value": "새로운 값 (update시, 없으면 null)",
-    "filter_author": "특정 작성자 (delete시 '모든', 없으면 null)",
-    "valid": true/false,
-    "confidence": 0.0-1.0,
-    "explanation": "파싱 결과 설명"
-}}
-
-명령 유형별 예시:
-1. 생성: "홍길동으로 새 게시글 작성해줘. 제목은 '4월 매출', 내용은 '증가했습니다', 수치값은 250.5"
-   → action: "create", author: "홍길동", title: "4월 매출", content: "증가했습니다", numeric_value: 250.5
-
-2. 수정: "1번 게시글 제목을 '새 제목'으로 바꿔줘"
-   → action: "update", post_id: 1, field_to_update: "title", new_value: "새 제목"
+            prompt = f'명령: "{command}"'
 
-3. 삭제: "2번 게시글 삭제해줘"
-   → action: "delete", post_id: 2
-
-4. 전체 삭제: "홍길동의 모든 게시글 삭제해줘"
-   → action: "delete", filter_author: "홍길동"
-
-5. 목록: "게시글 목록 보여줘" 또는 "홍길동의 게시글 보여줘"
-   → action: "list", filter_author: "홍길동" (또는 null)
-"""
-
-            response = await self.client.messages.create(
-                model=config.DEFAULT_MODEL,
+            # 스트리밍으로 받아 JSON 객체가 닫히는 즉시 파싱 (뒤따르는 설명 텍스트는 기다리지 않음)
+            response_text = await self._stream_message(
+                prompt,
                 max_tokens=1000,
-                messages=[{"role": "user", "content": prompt}]
+                stop_after_json_object=True,
+                system=[{"type": "text", "text": _POST_PARSE_SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}]
             )
-            
-            response_text = response.content[0].text.strip()
             print(f"🤖 AI 게시글 관리 파싱 결과: {response_text}")
             
-            # JSON 파싱
+            # JSON 파싱 및 형식 검증
             try:
-                parsed_result = json.loads(response_text)
+                parsed_result = ParsedPostCommand.model_validate_json(response_text).model_dump()
                 parsed_result["method"] = "ai_powered"
                 parsed_result["original_command"] = command
                 return parsed_result
-            except json.JSONDecodeError as e:
+            except ValidationError as e:
                 print(f"❌ JSON 파싱 오류: {e}")
                 return self._parse_post_command_fallback(command)
                 
@@ -1067,80 +1806,45 @@ window.myChart = new Chart(ctx, {{
             command_lower = command.lower()
             
             # 기본 결과
-            result = {
-                "action": None,
-                "post_id": None,
-                "author": None,
-                "title": None,
-                "content": None,
-                "numeric_value": None,
-                "category": None,
-                "field_to_update": None,
-                "new_value": None,
-                "filter_author": None,
-                "valid": False,
-                "confidence": 0.7,
-                "explanation": "정규표현식으로 파싱됨",
-                "method": "regex_fallback",
-                "original_command": command
-            }
+            result = _FALLBACK_RESULT_TEMPLATE.copy()
+            result["original_command"] = command
             
-            # 1. 게시글 생성 패턴
-            create_patterns = [
-                r'(.+?)(?:으로|로)\s*(?:새\s*)?게시글\s*작성',
-                r'(.+?)\s*게시글\s*(?:추가|생성|작성)',
-                r'새\s*게시글.*?작성자(?:\s*:|\s*는)?\s*(.+?)(?:\s|$)',
-                r'게시글\s*(?:추가|생성|작성).*?(.+?)(?:으로|로)'
-            ]
+            # 명령에 포함된 작업 키워드를 먼저 확인해, 키워드가 있는 작업의 패턴만 검사
+            actions = {action for keyword, action in _POST_ACTION_KEYWORDS.items() if keyword in command}
             
-            for pattern in create_patterns:
-                match = re.search(pattern, command)
-                if match:
-                    result["action"] = "create"
-                    result["author"] = match.group(1).strip()
-                    result["valid"] = True
-                    
-                    # 제목 추출
-                    title_patterns = [
-                        r'제목(?:\s*:|\s*은|\s*는)?\s*[\'"]([^\'\"]+)[\'"]',
-                        r'제목(?:\s*:|\s*은|\s*는)?\s*(.+?)(?:\s*,|\s*내용|\s*$)'
-                    ]
-                    for title_pattern in title_patterns:
-                        title_match = re.search(title_pattern, command)
-                        if title_match:
-                            result["title"] = title_match.group(1).strip()
-                            break
-                    
-                    # 내용 추출
-                    content_patterns = [
-                        r'내용(?:\s*:|\s*은|\s*는)?\s*[\'"]([^\'\"]+)[\'"]',
-                        r'내용(?:\s*:|\s*은|\s*는)?\s*(.+?)(?:\s*,|\s*수치|\s*$)'
-                    ]
-                    for content_pattern in content_patterns:
-                        content_match = re.search(content_pattern, command)
-                        if content_match:
-                            result["content"] = content_match.group(1).strip()
-                            break
-                    
-                    # 수치값 추출
-                    numeric_match = re.search(r'수치(?:값)?(?:\s*:|\s*은|\s*는)?\s*([\d.]+)', command)
-                    if numeric_match:
-                        try:
-                            result["numeric_value"] = float(numeric_match.group(1))
-                        except ValueError:
-                            pass
-                    
-                    break
+            # 1. 게시글 생성 패턴
+            author = _match_create_author(command) if "create" in actions else None
+            if author:
+                result["action"] = "create"
+                result["author"] = author
+                result["valid"] = True
+                
+                # 제목 추출
+                for title_pattern in _TITLE_PATTERNS:
+                    title_match = title_pattern.search(command)
+                    if title_match:
+                        result["title"] = title_match.group(1).strip()
+                        break
+                
+                # 내용 추출
+                for content_pattern in _CONTENT_PATTERNS:
+                    content_match = content_pattern.search(command)
+                    if content_match:
+                        result["content"] = content_match.group(1).strip()
+                        break
+                
+                # 수치값 추출
+                numeric_match = _NUMERIC_RE.search(command)
+                if numeric_match:
+                    try:
+                        result["numeric_value"] = float(numeric_match.group(1))
+                    except ValueError:
+                        pass
             
             # 2. 게시글 수정 패턴
-            if not result["valid"]:
-                update_patterns = [
-                    r'(\d+)번\s*게시글.*?(제목|내용|작성자)(?:\s*을|\s*를)?\s*[\'"]?([^\'\"]+)[\'"]?(?:으로|로)\s*(?:바꿔|수정|변경)',
-                    r'(\d+)번.*?(제목|내용|작성자)\s*(?:수정|변경|바꿔).*?[\'"]?([^\'\"]+)[\'"]?'
-                ]
-                
-                for pattern in update_patterns:
-                    match = re.search(pattern, command)
+            if not result["valid"] and "update" in actions and any(field in command for field in _UPDATE_FIELDS):
+                for pattern in _UPDATE_PATTERNS:
+                    match = pattern.search(command)
                     if match:
                         result["action"] = "update"
                         result["post_id"] = int(match.group(1))
@@ -1150,34 +1854,27 @@ window.myChart = new Chart(ctx, {{
                         break
             
             # 3. 게시글 삭제 패턴
-            if not result["valid"]:
-                delete_patterns = [
-                    r'(\d+)번\s*게시글\s*삭제',
-                    r'게시글\s*(\d+)\s*삭제',
-                    r'(.+?)(?:의)?\s*(?:모든\s*)?게시글\s*(?:모두\s*)?삭제'
-                ]
-                
-                for i, pattern in enumerate(delete_patterns):
-                    match = re.search(pattern, command)
+            if not result["valid"] and "delete" in actions:
+                # 특정 게시글 삭제
+                for pattern in _DELETE_ID_PATTERNS:
+                    match = pattern.search(command)
                     if match:
                         result["action"] = "delete"
+                        result["post_id"] = int(match.group(1))
                         result["valid"] = True
-                        
-                        if i < 2:  # 특정 게시글 삭제
-                            result["post_id"] = int(match.group(1))
-                        else:  # 작성자별 전체 삭제
-                            result["filter_author"] = match.group(1).strip()
                         break
+                else:
+                    # 작성자별 전체 삭제 (잘린 이름으로 다른 작성자의 글을 지우지 않도록 앞부분 전체를 작성자명으로 사용)
+                    filter_author = _text_before(command, _DELETE_SUFFIX_RE)
+                    if filter_author is not None:
+                        result["action"] = "delete"
+                        result["filter_author"] = filter_author
+                        result["valid"] = True
             
             # 4. 게시글 목록 패턴
-            if not result["valid"]:
-                list_patterns = [
-                    r'게시글\s*(?:목록|리스트)\s*(?:보여|표시)',
-                    r'(.+?)(?:의)?\s*게시글\s*(?:보여|표시|목록)'
-                ]
-                
-                for i, pattern in enumerate(list_patterns):
-                    match = re.search(pattern, command)
+            if not result["valid"] and "list" in actions:
+                for i, pattern in enumerate(_LIST_PATTERNS):
+                    match = pattern.search(command)
                     if match:
                         result["action"] = "list"
                         result["valid"] = True
@@ -1215,30 +1912,35 @@ async def get_mcp_status():
     """MCP 상태 확인"""
     return await real_mcp_server.get_api_status()
 
-# 테스트용 코드
+# 테스트용 코드 (python mcp_server_real.py test 로 실행)
 if __name__ == "__main__":
-    import asyncio
-    
-    async def test_real_mcp():
-        print("=== 실제 MCP 서버 테스트 ===")
-        
-        # API 상태 확인
-        status = await get_mcp_status()
-        print(f"MCP 상태: {status}")
-        
-        if real_mcp_server.is_real_mcp_available():
-            print("\n=== AI 명령 파싱 테스트 ===")
-            test_command = "홍길동의 데이터를 막대차트로 보여줘"
-            result = await parse_chart_command(test_command)
-            print(f"파싱 결과: {result}")
-            
-            print("\n=== AI 차트 생성 테스트 ===")
-            if result.get("valid"):
-                chart_result = await generate_author_chart(result["author_name"], result["chart_type"])
-                print(f"차트 생성: {chart_result['success']}")
-                print(f"메시지: {chart_result['message']}")
-        else:
-            print("⚠️ API 키가 설정되지 않아 시뮬레이션 모드로 실행됩니다.")
+    import sys
     
-    # 테스트 실행
-    asyncio.run(test_real_mcp())
\ No newline at end of file
+    if len(sys.argv) > 1 and sys.argv[1] == "test":
+        async def test_real_mcp():
+            print("=== 실제 MCP 서버 테스트 ===")
+            
+            # API 상태 확인
+            status = await get_mcp_status()
+            print(f"MCP 상태: {status}")
+            
+            if real_mcp_server.is_real_mcp_available():
+                print("\n=== AI 명령 파싱 테스트 ===")
+                test_command = "홍길동의 데이터를 막대차트로 보여줘"
+                result = await parse_chart_command(test_command)
+                print(f"파싱 결과: {result}")
+                
+                print("\n=== AI 차트 생성 테스트 ===")
+                if result.get("valid"):
+                    chart_result = await generate_author_chart(result["author_name"], result["chart_type"])
+                    print(f"차트 생성: {chart_result['success']}")
+                    print(f"메시지: {chart_result['message']}")
+            else:
+                print("⚠️ API 키가 설정되지 않아 시뮬레이션 모드로 실행됩니다.")
+        
+        # 테스트 실행 (API 호출을 위해 이벤트 루프 시작)
+        asyncio.run(test_real_mcp())
+    else:
+        # 상태만 확인 (이벤트 루프 없이)
+        print(f"실제 MCP 사용 가능: {real_mcp_server.is_real_mcp_available()}")
+        print("전체 테스트: python mcp_server_real.py test")
@@ -6,6 +6,7 @@ MCP 게시판 프로젝트 실행 스크립트
 import sys
 import subprocess
 import os
+import importlib.util
 
 def check_requirements():
     """필요한 패키지가 설치되어 있는지 확인"""
@@ -15,6 +16,11 @@ def check_requirements():
         import sqlalchemy
         import jinja2
         print("✅ 모든 필수 패키지가 설치되어 있습니다.")
+        
+        # 고성능 이벤트 루프/HTTP 파서 (uvicorn[standard]에 포함, Windows에서는 uvloop 미지원)
+        for module in ("uvloop", "httptools"):
+            if not has_module(module):
+                print(f"ℹ️ {module}가 설치되지 않아 기본 구현을 사용합니다.")
         return True
     except ImportError as e:
         print(f"❌ 필수 패키지가 설치되지 않았습니다: {e}")
@@ -22,6 +28,10 @@ def check_requirements():
         print("pip install -r requirements.txt")
         return False
 
+def has_module(name: str) -> bool:
+    """모듈 설치 여부 확인 (import 하지 않음)"""
+    return importlib.util.find_spec(name) is not None
+
 def run_server():
     """서버 실행"""
     if not check_requirements():
@@ -35,11 +45,15 @@ def run_server():
     try:
         # uvicorn으로 직접 FastAPI 앱 실행
         import uvicorn
+        from config import config
         uvicorn.run(
-            "app:app",  # app.py의 app 변수를 import string으로 지정
+            "app:app",  # app.py의 app 변수를 import string으로 지정 (workers 사용 시 필수)
             host="0.0.0.0",
             port=8000,
             reload=False,  # subprocess 환경에서는 reload 비활성화
+            workers=config.WORKERS,
+            loop="uvloop" if has_module("uvloop") else "asyncio",
+            http="httptools" if has_module("httptools") else "h11",
             log_level="info"
         )
     except KeyboardInterrupt: